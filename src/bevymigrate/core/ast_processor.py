@@ -4,20 +4,34 @@ Handles AST-based code transformations for Bevy migrations using ast-grep
 """
 
 
+import contextlib
+import difflib
+import functools
+import hashlib
+import inspect
 import logging
-import subprocess
-import json
-import tempfile
+import mmap
+import os
 import re
+import threading
+import fnmatch
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from typing import Dict, List, Optional, Any, Tuple, Callable, Pattern
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from bevymigrate.core.transform_cache import TransformCache
+from bevymigrate.utils.file_io import write_text_atomic
 
 try:
     import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     yaml = None
+    YamlLoader = None
     print("WARNING: PyYAML not found. Some features may not work.")
 
 try:
@@ -28,6 +42,118 @@ except ImportError:
     print("WARNING: ast-grep-py not found. Some features may not work.")
 
 
+# Tokens of an ast-grep pattern that are not copied literally into the regex fallback:
+# metavariables ($VAR, $$$VAR) and runs of whitespace
+_PATTERN_TOKEN_RE = re.compile(r'(\$\$?\$?[A-Z][A-Za-z0-9_]*)|\s+')
+
+# Number of leading bytes checked for NUL when detecting binary files
+_BINARY_SNIFF_SIZE = 4096
+
+_METAVARIABLE_RE = re.compile(r'\$+[A-Z_]?[A-Za-z0-9_]*')
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+def _format_hunk_range(start: int, stop: int) -> str:
+    """Format a line range for a unified diff hunk header"""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        return f"{start},0"
+    return f"{start + 1},{length}"
+
+
+def _unified_diff(original_lines: List[str], transformed_lines: List[str], context: int = 3) -> List[str]:
+    """
+    Unified diff of two line lists that only runs the line matcher on the changed region
+    
+    Common leading/trailing lines are trimmed before matching, and hunks are rendered
+    directly from the matcher's opcodes.
+    """
+    limit = min(len(original_lines), len(transformed_lines))
+    prefix = 0
+    while prefix < limit and original_lines[prefix] == transformed_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and original_lines[-1 - suffix] == transformed_lines[-1 - suffix]:
+        suffix += 1
+    
+    matcher = difflib.SequenceMatcher(
+        None,
+        original_lines[prefix:len(original_lines) - suffix],
+        transformed_lines[prefix:len(transformed_lines) - suffix],
+        autojunk=False
+    )
+    changes = [
+        (i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+    if not changes:
+        return []
+    
+    # Group changes separated by at most 2 * context unchanged lines into one hunk
+    hunks = [[changes[0]]]
+    for change in changes[1:]:
+        if change[0] - hunks[-1][-1][1] > 2 * context:
+            hunks.append([change])
+        else:
+            hunks[-1].append(change)
+    
+    diff = ["--- original", "+++ transformed"]
+    for hunk in hunks:
+        first_i1, _, first_j1, _ = hunk[0]
+        _, last_i2, _, last_j2 = hunk[-1]
+        leading = min(context, first_i1)
+        trailing = min(context, len(original_lines) - last_i2)
+        diff.append(
+            f"@@ -{_format_hunk_range(first_i1 - leading, last_i2 + trailing)} "
+            f"+{_format_hunk_range(first_j1 - leading, last_j2 + trailing)} @@"
+        )
+        
+        position = first_i1 - leading
+        for i1, i2, j1, j2 in hunk:
+            diff.extend(" " + line for line in original_lines[position:i1])
+            diff.extend("-" + line for line in original_lines[i1:i2])
+            diff.extend("+" + line for line in transformed_lines[j1:j2])
+            position = i2
+        diff.extend(" " + line for line in original_lines[position:last_i2 + trailing])
+    
+    return diff
+
+
+@functools.lru_cache(maxsize=1)
+def _ast_grep_available() -> bool:
+    """Check if ast-grep-py is available (checked and logged once per process)"""
+    logger = logging.getLogger(__name__)
+    if SgRoot is not None:
+        logger.info("ast-grep-py is available")
+        return True
+    else:
+        logger.warning("ast-grep-py not found, falling back to regex-based transformations")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _ast_grep_version() -> str:
+    """Installed ast-grep-py distribution version, or "unknown" if it can't be determined"""
+    try:
+        from importlib.metadata import version
+        return version("ast-grep-py")
+    except Exception:
+        return "unknown"
+
+
+def _extract_required_literals(pattern: str) -> Tuple[str, ...]:
+    """
+    Extract identifiers that must appear verbatim in any code matched by a pattern
+    
+    Metavariables are stripped first since they can match arbitrary code.
+    """
+    literals = _IDENTIFIER_RE.findall(_METAVARIABLE_RE.sub(" ", pattern))
+    return tuple(dict.fromkeys(literal for literal in literals if literal != "_"))
+
+
 @dataclass
 class ASTTransformation:
     """Represents a single AST transformation rule"""
@@ -38,21 +164,49 @@ class ASTTransformation:
     # New fields for complex logic
     callback: Optional[Callable[[Dict[str, str], Path, Dict[str, Any]], str]] = None
     rule_yaml: Optional[str] = None
+    # Regex fallback compiled lazily on first use and reused across files
+    _compiled_regex: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    # All file_patterns translated from globs into a single regex, normcased like fnmatch.fnmatch
+    _file_pattern_re: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    # Identifiers the content must contain for the pattern to match (empty for YAML rules)
+    _required_literals: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    # The same literals encoded for searching raw file bytes
+    _required_literal_bytes: Tuple[bytes, ...] = field(default=(), init=False, repr=False, compare=False)
+    # ast-grep rule dict and replacement, parsed from pattern/rule_yaml on first use
+    _ast_grep_rule: Optional[Tuple[Dict[str, Any], str]] = field(default=None, init=False, repr=False, compare=False)
+    # True if the regex fallback is a plain text replacement (no metavariables, whitespace or callback)
+    _is_literal: bool = field(default=False, init=False, repr=False, compare=False)
+    # Number of parameters the callback accepts, inspected on first use
+    _callback_args_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.file_patterns is None:
             self.file_patterns = ["*.rs"]
+        if self.file_patterns:
+            self._file_pattern_re = re.compile(
+                "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in self.file_patterns)
+            )
+        if not self.rule_yaml and self.pattern:
+            self._required_literals = _extract_required_literals(self.pattern)
+            self._required_literal_bytes = tuple(literal.encode() for literal in self._required_literals)
+        self._is_literal = bool(self.pattern) and self.callback is None and not _PATTERN_TOKEN_RE.search(self.pattern)
 
 
 @dataclass
 class TransformationResult:
-    """Result of applying AST transformations"""
+    """
+    Result of applying AST transformations
+    
+    Contents are left empty for files that were skipped because no transformation could match them,
+    and for all files when content was not kept; use `modified` to tell whether a file changed.
+    """
     file_path: Path
     original_content: str
     transformed_content: str
     applied_transformations: List[str]
     success: bool
     error_message: Optional[str] = None
+    modified: bool = False
 
 
 class ASTProcessor:
@@ -60,37 +214,71 @@ class ASTProcessor:
     AST processor that uses ast-grep for Rust code transformations
     """
     
-    def __init__(self, project_path: Path, dry_run: bool = False):
+    def __init__(self, project_path: Path, dry_run: bool = False, max_workers: Optional[int] = None):
         """
         Initialize the AST processor
         
         Args:
             project_path: Path to the project root
             dry_run: If True, don't modify files, just return what would be changed
+            max_workers: Number of worker threads for processing files (defaults to CPU count)
         """
         self.project_path = project_path
         self.dry_run = dry_run
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.logger = logging.getLogger(__name__)
         
+        # Last parsed tree per worker thread, reused while a file's content is unchanged
+        self._parse_cache = threading.local()
+        
+        # Root prefix for slicing relative paths out of absolute path strings
+        self._root_str = str(project_path)
+        self._root_len = len(self._root_str) + (0 if self._root_str.endswith(os.sep) else len(os.sep))
+        
         # Check if ast-grep is available
         self.ast_grep_available = self._check_ast_grep_availability()
         
         self.logger.info(f"AST processor initialized for project: {project_path}")
         self.logger.info(f"Dry run mode: {dry_run}")
     
+    def relative_path(self, file_path: Path) -> str:
+        """
+        Get a file's path relative to the project root, as str(file_path.relative_to(project_path))
+        
+        Paths under the root are sliced out of the path string instead of comparing path parts.
+        
+        Args:
+            file_path: Path inside the project
+            
+        Returns:
+            Relative path string
+        """
+        path_str = str(file_path)
+        if path_str.startswith(self._root_str) and path_str[self._root_len - len(os.sep):self._root_len] == os.sep:
+            return path_str[self._root_len:]
+        return str(file_path.relative_to(self.project_path))
+    
+    def backend_version(self) -> str:
+        """
+        Describe the engine applying transformations, e.g. "ast-grep-py 0.31.1" or "regex"
+        
+        Results differ between backends (and ast-grep releases), so caches of
+        transformation results include this in their keys.
+        """
+        if self.ast_grep_available:
+            return f"ast-grep-py {_ast_grep_version()}"
+        return "regex"
+    
     def _check_ast_grep_availability(self) -> bool:
         """Check if ast-grep-py is available"""
-        if SgRoot is not None:
-            self.logger.info("ast-grep-py is available")
-            return True
-        else:
-            self.logger.warning("ast-grep-py not found, falling back to regex-based transformations")
-            return False
+        return _ast_grep_available()
     
     def apply_transformations(
         self,
         file_paths: List[Path],
-        transformations: List[ASTTransformation]
+        transformations: List[ASTTransformation],
+        keep_content: bool = True,
+        persistent_cache: Optional[TransformCache] = None
     ) -> List[TransformationResult]:
         """
         Apply AST transformations to a list of files
@@ -98,45 +286,106 @@ class ASTProcessor:
         Args:
             file_paths: List of file paths to transform
             transformations: List of transformation rules to apply
+            keep_content: If False, results don't hold file contents (only the `modified` flag)
+            persistent_cache: Optional cache of results from earlier runs, consulted and filled
+                alongside the per-run cache
             
         Returns:
             List of transformation results
         """
-        results = []
+        # Byte-identical files (vendored or duplicated sources) are only transformed once
+        transform_cache: Dict[Tuple[bytes, Tuple[int, ...]], Tuple[Optional[str], List[str]]] = {}
         
-        for file_path in file_paths:
+        def process(file_path: Path) -> TransformationResult:
             try:
-                result = self._process_file(file_path, transformations)
-                results.append(result)
+                return self._process_file(
+                    file_path, transformations, transform_cache, keep_content, persistent_cache
+                )
             except Exception as e:
                 self.logger.error(f"Failed to process file {file_path}: {e}", exc_info=True)
-                results.append(TransformationResult(
+                return TransformationResult(
                     file_path=file_path,
                     original_content="",
                     transformed_content="",
                     applied_transformations=[],
                     success=False,
                     error_message=str(e)
-                ))
+                )
         
-        return results
+        # Files are independent, so process them concurrently (results keep input order)
+        workers = min(self.max_workers, len(file_paths))
+        if workers <= 1:
+            return [process(file_path) for file_path in file_paths]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(process, file_paths))
     
     def _process_file(
         self,
         file_path: Path,
-        transformations: List[ASTTransformation]
+        transformations: List[ASTTransformation],
+        transform_cache: Optional[Dict[Tuple[bytes, Tuple[int, ...]], Tuple[Optional[str], List[str]]]] = None,
+        keep_content: bool = True,
+        persistent_cache: Optional[TransformCache] = None
     ) -> TransformationResult:
-        """Process a single file with the given transformations"""
+        """
+        Process a single file with the given transformations
+        
+        Args:
+            file_path: Path to the file to transform
+            transformations: List of transformation rules to apply
+            transform_cache: Optional cache of results keyed by (content digest, applicable
+                transformation indices), shared between files of the same run; the digest also
+                covers the relative path when a callback applies
+            keep_content: If False, the result doesn't hold the file contents
+            persistent_cache: Optional cache of results from earlier runs, checked on a per-run miss
+        """
         try:
-            # Read original content
-            with open(file_path, 'r', encoding='utf-8', newline='') as f:
-                original_content = f.read()
-            transformed_content = original_content
-            applied_transformations = []
+            relative_path = self.relative_path(file_path)
+            applicable_indices = tuple(
+                index for index, transformation in enumerate(transformations)
+                if self._should_apply_transformation(file_path, transformation, relative_path)
+            )
+            applicable_transformations = [transformations[index] for index in applicable_indices]
             
-            # Apply each transformation
-            for transformation in transformations:
-                if self._should_apply_transformation(file_path, transformation):
+            # Read original content, unless nothing targets this file or can match it
+            original_content = None
+            if applicable_transformations:
+                original_content = self._read_candidate_content(file_path, applicable_transformations)
+            if original_content is None:
+                return TransformationResult(
+                    file_path=file_path,
+                    original_content="",
+                    transformed_content="",
+                    applied_transformations=[],
+                    success=True
+                )
+            cache_key = None
+            cached = None
+            if transform_cache is not None or persistent_cache is not None:
+                digest = hashlib.blake2b(original_content.encode('utf-8'))
+                # Callbacks receive the file path, so their results are only shared by the same file
+                if any(transformation.callback is not None for transformation in applicable_transformations):
+                    digest.update(b"\0" + relative_path.encode('utf-8'))
+                cache_key = (digest.digest(), applicable_indices)
+            if transform_cache is not None:
+                cached = transform_cache.get(cache_key)
+            if cached is None and persistent_cache is not None:
+                cached = persistent_cache.get(*cache_key)
+                if cached is not None and transform_cache is not None:
+                    transform_cache[cache_key] = cached
+            
+            if cached is not None:
+                # Only changed content is cached; None means the transformations were no-ops
+                transformed_content = original_content if cached[0] is None else cached[0]
+                applied_transformations = list(cached[1])
+                self.logger.debug(f"Reused transformations of identical content for {file_path}")
+            else:
+                transformed_content = original_content
+                applied_transformations = []
+                
+                # Apply each transformation
+                for transformation in applicable_transformations:
                     new_content = self._apply_single_transformation(
                         transformed_content,
                         transformation,
@@ -147,19 +396,31 @@ class ASTProcessor:
                         transformed_content = new_content
                         applied_transformations.append(transformation.description)
                         self.logger.debug(f"Applied transformation '{transformation.description}' to {file_path}")
+                
+                if cache_key is not None:
+                    cached = (
+                        transformed_content if transformed_content != original_content else None,
+                        list(applied_transformations)
+                    )
+                    if transform_cache is not None:
+                        transform_cache[cache_key] = cached
+                    if persistent_cache is not None:
+                        persistent_cache.put(*cache_key, *cached)
+            
+            modified = transformed_content != original_content
             
             # Write transformed content if not in dry run mode
-            if not self.dry_run and transformed_content != original_content:
-                with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                    f.write(transformed_content)
+            if not self.dry_run and modified:
+                write_text_atomic(file_path, transformed_content)
                 self.logger.info(f"Updated file: {file_path}")
             
             return TransformationResult(
                 file_path=file_path,
-                original_content=original_content,
-                transformed_content=transformed_content,
+                original_content=original_content if keep_content else "",
+                transformed_content=transformed_content if keep_content else "",
                 applied_transformations=applied_transformations,
-                success=True
+                success=True,
+                modified=modified
             )
             
         except Exception as e:
@@ -173,22 +434,65 @@ class ASTProcessor:
                 error_message=str(e)
             )
     
+    def _read_candidate_content(
+        self,
+        file_path: Path,
+        transformations: List[ASTTransformation]
+    ) -> Optional[str]:
+        """
+        Read a file's text only if at least one transformation could match it
+        
+        The raw bytes are scanned through mmap for each transformation's required
+        literals and are decoded only once some transformation has all of them.
+        Literals shared between transformations are searched for only once, and
+        files with a NUL byte in their first block are treated as binary and skipped.
+        
+        Returns:
+            File content, or None if no transformation can match
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else contextlib.nullcontext(b"")
+            with mapping as data:
+                # Source files never contain NUL bytes; skip binary files without scanning them
+                if data.find(b"\0", 0, _BINARY_SNIFF_SIZE) != -1:
+                    self.logger.debug(f"Skipping binary file: {file_path}")
+                    return None
+                
+                present: Dict[bytes, bool] = {}
+                
+                def contains(literal: bytes) -> bool:
+                    found = present.get(literal)
+                    if found is None:
+                        found = present[literal] = data.find(literal) != -1
+                    return found
+                
+                for transformation in transformations:
+                    if all(contains(literal) for literal in transformation._required_literal_bytes):
+                        # Decode straight from the mapping (no intermediate bytes copy),
+                        # as-is so line endings are preserved (like newline='')
+                        return str(data, 'utf-8')
+        return None
+    
     def _should_apply_transformation(
         self,
         file_path: Path,
-        transformation: ASTTransformation
+        transformation: ASTTransformation,
+        relative_path: Optional[str] = None
     ) -> bool:
         """Check if a transformation should be applied to a file"""
-        import fnmatch
-        
-        file_name = file_path.name
-        relative_path = str(file_path.relative_to(self.project_path))
+        pattern_re = transformation._file_pattern_re
+        if pattern_re is None:
+            return False
         
-        for pattern in transformation.file_patterns:
-            if fnmatch.fnmatch(file_name, pattern) or fnmatch.fnmatch(relative_path, pattern):
-                return True
+        if relative_path is None:
+            relative_path = self.relative_path(file_path)
         
-        return False
+        # fnmatch.fnmatch normcases both sides (case and separators on Windows)
+        return bool(
+            pattern_re.match(os.path.normcase(file_path.name))
+            or pattern_re.match(os.path.normcase(relative_path))
+        )
     
     def _apply_single_transformation(
         self,
@@ -197,6 +501,11 @@ class ASTProcessor:
         file_path: Path
     ) -> Optional[str]:
         """Apply a single transformation to content"""
+        # Cheap literal prefilter: the pattern cannot match if any of its identifiers is missing
+        for literal in transformation._required_literals:
+            if literal not in content:
+                return content
+        
         try:
             # Try ast-grep first if available
             if self.ast_grep_available:
@@ -229,63 +538,38 @@ class ASTProcessor:
             if file_path.suffix == ".toml":
                 return None
             
-            root = SgRoot(content, language)
+            # Prepare the rule (parsed once per transformation)
+            rule_dict, replacement = self._get_ast_grep_rule(transformation)
+            if not rule_dict:
+                return None
+            
+            root = self._parse_source(content, language)
             node = root.root()
 
-            # Prepare the rule
-            if not transformation.rule_yaml:
-                # If it's a bare word (identifier), use regex to match regardless of AST kind
-                # (e.g. both 'identifier' and 'type_identifier' in Rust)
-                if re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', transformation.pattern):
-                    rule_dict = {"regex": f"^{transformation.pattern}$"}
-                else:
-                    rule_dict = {"pattern": transformation.pattern}
-            else:
-                rule_dict = {}
-                if yaml:
-                    rule_loaded = yaml.safe_load(transformation.rule_yaml)
-                    if isinstance(rule_loaded, dict):
-                        # Extract the 'rule' part if it's a full config
-                        rule_dict = rule_loaded.get("rule", rule_loaded)
-                    else:
-                        return None
-                else:
-                    self.logger.warning("PyYAML not found, cannot process complex rules")
-                    return None
-
             if not transformation.callback:
                 # Simple replacement
                 # In ast-grep-py, we search and then manually replace using edits
-                
-                # Check if YAML rule has a 'fix'
-                replacement = transformation.replacement
-                if transformation.rule_yaml and not replacement:
-                    if yaml:
-                        rule_loaded = yaml.safe_load(transformation.rule_yaml)
-                        if isinstance(rule_loaded, dict) and "fix" in rule_loaded:
-                            replacement = rule_loaded["fix"]
-
                 matches = node.find_all(**rule_dict)
                 if not matches:
                     return None
 
+                # Find all $VAR in replacement (once for all matches)
+                vars_in_replacement = set(re.findall(r'\$[A-Z][A-Za-z0-9]*|\$\$\$[A-Z][A-Za-z0-9]*', replacement)) if "$" in replacement else ()
+                
                 edits = []
                 for match in matches:
                     curr_replacement = replacement
                     
-                    # Extract metavariables if present in replacement
-                    if "$" in curr_replacement:
-                        # Find all $VAR in replacement
-                        vars_in_replacement = re.findall(r'\$[A-Z][A-Za-z0-9]*|\$\$\$[A-Z][A-Za-z0-9]*', curr_replacement)
-                        for var in set(vars_in_replacement):
-                            var_name = var.lstrip('$')
-                            match_nodes = match.get_multiple_matches(var_name)
-                            if match_nodes:
-                                curr_replacement = curr_replacement.replace(var, "".join(m.text() for m in match_nodes))
-                            else:
-                                match_node = match.get_match(var_name)
-                                if match_node:
-                                    curr_replacement = curr_replacement.replace(var, match_node.text())
+                    # Substitute metavariables present in replacement
+                    for var in vars_in_replacement:
+                        var_name = var.lstrip('$')
+                        match_nodes = match.get_multiple_matches(var_name)
+                        if match_nodes:
+                            curr_replacement = curr_replacement.replace(var, "".join(m.text() for m in match_nodes))
+                        else:
+                            match_node = match.get_match(var_name)
+                            if match_node:
+                                curr_replacement = curr_replacement.replace(var, match_node.text())
                     
                     edits.append(match.replace(curr_replacement))
 
@@ -297,23 +581,19 @@ class ASTProcessor:
                     return None
 
                 edits = []
-                import inspect
-                try:
-                    sig = inspect.signature(transformation.callback)
-                    callback_args_count = len(sig.parameters)
-                except:
-                    callback_args_count = 3 # Default fallback
+                callback_args_count = self._get_callback_args_count(transformation)
+
+                # Try to extract potential vars from pattern/rule (once for all matches)
+                potential_vars = re.findall(r'\$[A-Z][A-Za-z0-9]*', transformation.pattern)
+                if transformation.rule_yaml:
+                    potential_vars.extend(re.findall(r'\$[A-Z][A-Za-z0-9]*', transformation.rule_yaml))
+                potential_vars = set(potential_vars)
 
                 for match in matches:
                     # Extract metavariables
                     meta_vars = {"_matched_text": match.text()}
                     
-                    # Try to extract potential vars from pattern/rule
-                    potential_vars = re.findall(r'\$[A-Z][A-Za-z0-9]*', transformation.pattern)
-                    if transformation.rule_yaml:
-                        potential_vars.extend(re.findall(r'\$[A-Z][A-Za-z0-9]*', transformation.rule_yaml))
-                    
-                    for var in set(potential_vars):
+                    for var in potential_vars:
                         var_name = var[1:]
                         match_node = match.get_match(var_name)
                         if match_node:
@@ -348,6 +628,55 @@ class ASTProcessor:
             self.logger.debug(f"ast-grep-py transformation failed: {e}", exc_info=True)
             return None
     
+    def _parse_source(self, content: str, language: str) -> Any:
+        """
+        Parse source code with ast-grep-py, reusing the previous tree for the same content
+        
+        Transformations of a file run one after another on the same string object until
+        one of them changes it, so the file is only re-parsed after an actual edit.
+        """
+        cached = getattr(self._parse_cache, "entry", None)
+        if cached is not None and cached[0] is content and cached[1] == language:
+            return cached[2]
+        
+        root = SgRoot(content, language)
+        self._parse_cache.entry = (content, language, root)
+        return root
+    
+    def _get_ast_grep_rule(self, transformation: ASTTransformation) -> Tuple[Dict[str, Any], str]:
+        """
+        Get the ast-grep rule and replacement for a transformation, building them on first use
+        
+        Returns:
+            Tuple of (rule dict, replacement); the rule dict is empty if the rule is unusable
+        """
+        if transformation._ast_grep_rule is not None:
+            return transformation._ast_grep_rule
+        
+        replacement = transformation.replacement
+        if not transformation.rule_yaml:
+            # If it's a bare word (identifier), use regex to match regardless of AST kind
+            # (e.g. both 'identifier' and 'type_identifier' in Rust)
+            if re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', transformation.pattern):
+                rule_dict = {"regex": f"^{transformation.pattern}$"}
+            else:
+                rule_dict = {"pattern": transformation.pattern}
+        elif yaml:
+            rule_dict = {}
+            rule_loaded = yaml.load(transformation.rule_yaml, Loader=YamlLoader)
+            if isinstance(rule_loaded, dict):
+                # Extract the 'rule' part if it's a full config
+                rule_dict = rule_loaded.get("rule", rule_loaded)
+                # Use the YAML rule's 'fix' if no replacement was given
+                if not replacement and "fix" in rule_loaded:
+                    replacement = rule_loaded["fix"]
+        else:
+            self.logger.warning("PyYAML not found, cannot process complex rules")
+            rule_dict = {}
+        
+        transformation._ast_grep_rule = (rule_dict, replacement)
+        return transformation._ast_grep_rule
+    
     def _apply_regex_transformation(
         self,
         content: str,
@@ -355,33 +684,32 @@ class ASTProcessor:
         file_path: Optional[Path] = None
     ) -> str:
         """Apply transformation using regex as fallback"""
-        import re
-
+        # Plain text patterns would compile to a literal regex, str.replace does the same faster
+        if transformation._is_literal:
+            return content.replace(transformation.pattern, transformation.replacement)
+        
         try:
-            # Count how many metavariables are in the pattern to map them to groups
-            metavariables = re.findall(r'\$\$?\$?[A-Z][A-Za-z0-9]*', transformation.pattern)
-            unique_vars = list(dict.fromkeys(metavariables))  # Preserve order, remove duplicates
+            # Every metavariable occurrence becomes one capture group, in pattern order;
+            # map each variable to the group of its first occurrence
+            occurrences = [token.group(1) for token in _PATTERN_TOKEN_RE.finditer(transformation.pattern) if token.group(1)]
+            var_groups: Dict[str, int] = {}
+            for group_num, var in enumerate(occurrences, start=1):
+                var_groups.setdefault(var, group_num)
+            # Substitute longer names first so $A doesn't clobber part of $AB
+            replacement_vars = sorted(var_groups.items(), key=lambda item: len(item[0]), reverse=True)
             
-            # Convert ast-grep pattern to regex (simplified approach)
-            pattern_regex = self._convert_ast_pattern_to_regex(transformation.pattern)
+            # Convert ast-grep pattern to regex once per transformation
+            pattern_regex = self._get_compiled_regex(transformation)
             
             def replace_func(match):
                 # Extract variables from groups
                 meta_vars = {"_matched_text": match.group(0)}
-                for i, var in enumerate(unique_vars):
-                    group_num = i + 1
-                    if group_num <= len(match.groups()):
-                        var_name = var.lstrip('$')
-                        meta_vars[var_name] = match.group(group_num)
+                for var, group_num in var_groups.items():
+                    meta_vars[var.lstrip('$')] = match.group(group_num)
                 
                 if transformation.callback:
                     # Callback support
-                    import inspect
-                    try:
-                        sig = inspect.signature(transformation.callback)
-                        callback_args_count = len(sig.parameters)
-                    except:
-                        callback_args_count = 3
+                    callback_args_count = self._get_callback_args_count(transformation)
 
                     # Provide match data for compatibility
                     match_data = {
@@ -400,64 +728,65 @@ class ASTProcessor:
                 else:
                     # Simple replacement support
                     result = transformation.replacement
-                    for i, var in enumerate(unique_vars):
-                        group_num = i + 1
-                        if group_num <= len(match.groups()):
-                            result = result.replace(var, match.group(group_num))
+                    for var, group_num in replacement_vars:
+                        result = result.replace(var, match.group(group_num))
                     return result
             
             # Apply regex substitution with the function
-            transformed_content = re.sub(pattern_regex, replace_func, content, flags=re.MULTILINE)
+            transformed_content = pattern_regex.sub(replace_func, content)
             return transformed_content
 
         except Exception as e:
             self.logger.warning(f"Regex transformation failed: {e}")
             return content
     
+    def _get_callback_args_count(self, transformation: ASTTransformation) -> int:
+        """Get the number of parameters of a transformation's callback, inspecting it on first use"""
+        if transformation._callback_args_count is None:
+            try:
+                sig = inspect.signature(transformation.callback)
+                transformation._callback_args_count = len(sig.parameters)
+            except (TypeError, ValueError):
+                transformation._callback_args_count = 3 # Default fallback
+        return transformation._callback_args_count
+    
+    def _get_compiled_regex(self, transformation: ASTTransformation) -> Pattern:
+        """Get the compiled regex fallback for a transformation, compiling it on first use"""
+        if transformation._compiled_regex is None:
+            transformation._compiled_regex = re.compile(
+                self._convert_ast_pattern_to_regex(transformation.pattern),
+                re.MULTILINE
+            )
+        return transformation._compiled_regex
+    
     def _convert_ast_pattern_to_regex(self, ast_pattern: str) -> str:
         """
-        Convert ast-grep pattern to regex pattern (improved)
+        Convert ast-grep pattern to regex pattern in a single pass over its tokens
         """
         if not ast_pattern:
             return ""
+        
+        parts = []
+        position = 0
+        for token in _PATTERN_TOKEN_RE.finditer(ast_pattern):
+            # Escape the literal text preceding the token
+            parts.append(re.escape(ast_pattern[position:token.start()]))
+            position = token.end()
             
-        import re
-        
-        # 1. Replace metavariables with placeholders to protect them from escape
-        placeholders = {}
-        # Support $VAR and $$$VAR
-        metavariables = re.findall(r'\$\$?\$?[A-Z][A-Za-z0-9_]*', ast_pattern)
-        unique_vars = list(dict.fromkeys(metavariables))
-        
-        pattern = ast_pattern
-        for i, var in enumerate(unique_vars):
-            placeholder = f"__PVAR_{i}__"
-            placeholders[placeholder] = var
-            pattern = pattern.replace(var, placeholder)
-            
-        # 2. Escape the rest of the pattern
-        escaped = re.escape(pattern)
-        
-        # 3. Replace placeholders with capture groups
-        # For $VAR we use ([^<>(){}]+) (simple capture)
-        # For $$$VAR we use (.*) (greedy capture)
-        for placeholder, var in placeholders.items():
-            if var.startswith("$$$"):
-                group = r"(.*)"
+            var = token.group(1)
+            if var is None:
+                # Make whitespace flexible
+                parts.append(r"\s+")
+            elif var.startswith("$$$"):
+                # For $$$VAR we use (.*) (greedy capture)
+                parts.append(r"(.*)")
             else:
                 # Use a match for $VAR that avoids crossing major boundaries like ( ) or :
                 # This prevents matching from the start of a function when we want a parameter
-                group = r"([^()<>:]+?)"
-                
-            escaped = escaped.replace(re.escape(placeholder), group)
-            
-        # 4. Make whitespace flexible
-        # Replace escaped spaces with \s+
-        escaped = re.sub(r'\\\s+', r'\\s+', escaped)
-        # Replace multiple \s+ with single \s+
-        escaped = re.sub(r'(\\s\+)+', r'\\s+', escaped)
+                parts.append(r"([^()<>:]+?)")
         
-        return escaped
+        parts.append(re.escape(ast_pattern[position:]))
+        return "".join(parts)
     
     def create_bevy_transformation(
         self,
@@ -516,10 +845,10 @@ class ASTProcessor:
                 self.logger.error("Transformation replacement cannot be empty")
                 return False
             
-            # Try to compile the pattern as regex (fallback validation)
+            # Try to compile the pattern as regex (fallback validation); the compiled
+            # regex is kept on the transformation for the regex fallback to reuse
             try:
-                regex_pattern = self._convert_ast_pattern_to_regex(transformation.pattern)
-                re.compile(regex_pattern)
+                self._get_compiled_regex(transformation)
             except re.error as e:
                 self.logger.warning(f"Pattern may not be valid regex: {e}")
                 # Don't fail validation for this, as it might be valid ast-grep syntax
@@ -530,6 +859,21 @@ class ASTProcessor:
             self.logger.error(f"Transformation validation failed: {e}")
             return False
     
+    def validate_transformations(self, transformations: List[ASTTransformation]) -> Optional[ASTTransformation]:
+        """
+        Validate transformations, stopping at the first invalid one
+        
+        Args:
+            transformations: The transformations to validate
+            
+        Returns:
+            The first invalid transformation, or None if all are valid
+        """
+        for transformation in transformations:
+            if not self.validate_transformation(transformation):
+                return transformation
+        return None
+    
     def get_transformation_preview(
         self,
         content: str,
@@ -553,23 +897,16 @@ class ASTProcessor:
                 Path("preview.rs")  # Dummy path for preview
             )
             
-            # Calculate diff information
-            original_lines = content.splitlines()
-            transformed_lines = transformed_content.splitlines()
-            
-            import difflib
-            diff = list(difflib.unified_diff(
-                original_lines,
-                transformed_lines,
-                fromfile="original",
-                tofile="transformed",
-                lineterm=""
-            ))
+            # Calculate diff information (nothing to diff if the transformation was a no-op)
+            has_changes = content != transformed_content
+            diff = []
+            if has_changes:
+                diff = _unified_diff(content.splitlines(), transformed_content.splitlines())
             
             return {
                 "original_content": content,
                 "transformed_content": transformed_content,
-                "has_changes": content != transformed_content,
+                "has_changes": has_changes,
                 "diff": diff,
                 "transformation_description": transformation.description
             }
@@ -603,13 +940,14 @@ class ASTProcessor:
         if file_patterns is None:
             file_patterns = ["**/*.rs"]
         
-        # Find all matching files
-        matching_files = []
+        # Find all matching files, deduplicating as we go so overlapping
+        # patterns don't stat the same path twice
+        matching_files: Dict[Path, None] = {}
         for pattern in file_patterns:
-            matching_files.extend(self.project_path.glob(pattern))
-        
-        # Remove duplicates and filter out non-files
-        unique_files = list(set(f for f in matching_files if f.is_file()))
+            for file_path in self.project_path.glob(pattern):
+                if file_path not in matching_files and file_path.is_file():
+                    matching_files[file_path] = None
+        unique_files = list(matching_files)
         
         self.logger.info(f"Found {len(unique_files)} files to process")
         
@@ -627,24 +965,24 @@ class ASTProcessor:
             Dictionary with statistics
         """
         total_files = len(results)
-        successful_files = sum(1 for r in results if r.success)
-        failed_files = total_files - successful_files
-        modified_files = sum(1 for r in results if r.success and r.original_content != r.transformed_content)
+        successful_files = 0
+        modified_files = 0
+        transformation_counts = Counter()
         
-        # Count transformations applied
-        all_transformations = []
+        # Single pass over the results
         for result in results:
-            all_transformations.extend(result.applied_transformations)
-        
-        transformation_counts = {}
-        for transformation in all_transformations:
-            transformation_counts[transformation] = transformation_counts.get(transformation, 0) + 1
+            if result.success:
+                successful_files += 1
+                if result.modified:
+                    modified_files += 1
+            # Count transformations applied
+            transformation_counts.update(result.applied_transformations)
         
         return {
             "total_files": total_files,
             "successful_files": successful_files,
-            "failed_files": failed_files,
+            "failed_files": total_files - successful_files,
             "modified_files": modified_files,
-            "transformation_counts": transformation_counts,
+            "transformation_counts": dict(transformation_counts),
             "success_rate": successful_files / total_files if total_files > 0 else 0.0
         }
\ No newline at end of file
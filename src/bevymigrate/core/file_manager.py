@@ -5,10 +5,140 @@ Manages file discovery, filtering, and basic file operations for Bevy projects
 
 import logging
 import fnmatch
+import functools
+import mmap
+import os
+import re
+import shutil
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Set, Tuple
 from dataclasses import dataclass
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Marks a node of the excluded-directory trie whose whole subtree is excluded
+_TRIE_END = '/'
+
+# Leading bytes inspected for NUL when telling binary files from text
+_BINARY_SNIFF_SIZE = 4096
+
+# File classification
+_CONFIG_EXTS = frozenset({'.toml', '.yaml', '.yml', '.json'})
+_CONFIG_SUFFIXES = tuple(_CONFIG_EXTS)  # str.endswith needs a tuple
+_CARGO_NAMES = frozenset({'Cargo.toml', 'Cargo.lock'})
+
+
+# ioctl request cloning a whole file on Linux copy-on-write filesystems (btrfs, XFS)
+_FICLONE = 0x40049409
+
+
+def _ficlone(src_fd: int, dst_fd: int, count: int) -> int:
+    """
+    Make the destination share the source's extents with the FICLONE ioctl
+    
+    The whole file is cloned at once, so 0 (nothing left to copy) is returned.
+    Raises OSError when the filesystem can't clone (EXDEV, EOPNOTSUPP, ...).
+    """
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    return 0
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    """Copy up to count bytes between file descriptors with os.sendfile"""
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+# Kernel-side copy primitives in order of preference, each called as
+# copy(src_fd, dst_fd, count) and returning the number of bytes copied
+_KERNEL_COPIES: List[Callable[[int, int, int], int]] = []
+if fcntl is not None and sys.platform.startswith('linux'):
+    _KERNEL_COPIES.append(_ficlone)
+if hasattr(os, 'copy_file_range'):
+    _KERNEL_COPIES.append(os.copy_file_range)
+if hasattr(os, 'sendfile'):
+    _KERNEL_COPIES.append(_sendfile)
+
+
+def _suffix(name: str) -> str:
+    """Return the file extension of a bare filename, like ``Path.suffix``"""
+    index = name.rfind('.')
+    if 0 < index < len(name) - 1:
+        return name[index:]
+    return ''
+
+
+def _compile_fnmatch(patterns: List[str]) -> Optional[Pattern[str]]:
+    """
+    Compile fnmatch-style patterns into a single alternation
+    
+    Args:
+        patterns: Patterns understood by ``fnmatch.fnmatch``
+        
+    Returns:
+        Compiled regex to be used with ``match``, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns))
+
+
+def _translate_glob_segment(segment: str) -> str:
+    """Translate a single path segment of a glob into a regex that never crosses '/'"""
+    parts = []
+    i, n = 0, len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = segment.find(']', i + 1 if i < n and segment[i] == '!' else i)
+            if end == -1:
+                parts.append(re.escape(char))
+                continue
+            body = segment[i:end].replace('\\', '\\\\')
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+
+def _compile_rglob(pattern: str) -> Pattern[str]:
+    """
+    Compile a glob into a regex over '/'-separated relative paths with the
+    same semantics as ``Path.rglob(pattern)``
+    
+    Args:
+        pattern: Glob pattern, implicitly anchored below any directory
+        
+    Returns:
+        Compiled regex to be used with ``fullmatch``
+    """
+    regex = ['(?:.*/)?']
+    segments = [segment for segment in pattern.split('/') if segment]
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == '**':
+            regex.append('.*' if last else '(?:.*/)?')
+        else:
+            regex.append(_translate_glob_segment(segment))
+            if not last:
+                regex.append('/')
+    return re.compile(''.join(regex), re.DOTALL)
+
 
 @dataclass
 class FileInfo:
@@ -24,15 +154,35 @@ class FileInfo:
     def from_path(cls, file_path: Path, project_root: Path) -> 'FileInfo':
         """Create FileInfo from a file path"""
         relative_path = file_path.relative_to(project_root)
-        size = file_path.stat().st_size if file_path.exists() else 0
+        try:
+            size = file_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            size = 0
+        
+        return cls._classify(file_path, relative_path, file_path.name, size)
+    
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry, relative_str: str) -> 'FileInfo':
+        """Create FileInfo from a scandir entry, reusing its cached stat"""
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            size = 0
+        
+        return cls._classify(Path(entry.path), Path(relative_str), entry.name, size)
+    
+    @classmethod
+    def _classify(cls, path: Path, relative_path: Path, name: str, size: int) -> 'FileInfo':
+        """Create FileInfo, deriving the file kind flags from the filename"""
+        suffix = _suffix(name)
         
         return cls(
-            path=file_path,
+            path=path,
             relative_path=relative_path,
             size=size,
-            is_rust_file=file_path.suffix == '.rs',
-            is_cargo_file=file_path.name in ['Cargo.toml', 'Cargo.lock'],
-            is_config_file=file_path.suffix in ['.toml', '.yaml', '.yml', '.json']
+            is_rust_file=suffix == '.rs',
+            is_cargo_file=name in _CARGO_NAMES,
+            is_config_file=suffix in _CONFIG_EXTS
         )
 
 
@@ -41,16 +191,29 @@ class FileManager:
     File manager for handling file operations during Bevy migrations
     """
     
-    def __init__(self, project_path: Path, exclude_patterns: Optional[List[str]] = None):
+    # Upper bound on the characters kept by the read_file_content cache
+    CONTENT_CACHE_LIMIT = 64 * 1024 * 1024
+    
+    # Below this many files, per-file I/O runs serially rather than in a thread pool
+    PARALLEL_THRESHOLD = 8
+    
+    def __init__(
+        self,
+        project_path: Path,
+        exclude_patterns: Optional[List[str]] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Initialize the file manager
         
         Args:
             project_path: Path to the project root
             exclude_patterns: List of patterns to exclude from operations
+            max_workers: Number of threads for I/O-bound per-file work (defaults to 4x CPU count)
         """
         self.project_path = project_path
         self.exclude_patterns = exclude_patterns or []
+        self.max_workers = max_workers or (os.cpu_count() or 1) * 4
         self.logger = logging.getLogger(__name__)
         
         # Keep track of logged exclusions to avoid redundant messages
@@ -68,59 +231,111 @@ class FileManager:
             '.idea/**',
             '*.tmp',
             '*.bak',
-            'migration_backup/**'
+            'migration_backup/**',
+            '.bevy_migrate_cache/**'
         ]
         
         # Combine user patterns with defaults
         self.all_exclude_patterns = self.default_excludes + self.exclude_patterns
         
+        # Directory globs of the form "X/**" exclude every descendant of a
+        # matching directory, so the walk can skip those subtrees entirely.
+        # Literal prefixes go into a trie of path segments that the walk
+        # follows as it descends; wildcard prefixes fall back to a regex.
+        self._excluded_dir_trie: Dict[str, Any] = {}
+        wildcard_dir_patterns = []
+        for pattern in self.all_exclude_patterns:
+            if not pattern.endswith('/**'):
+                continue
+            prefix = pattern[:-3]
+            segments = [os.path.normcase(segment) for segment in prefix.split('/') if segment]
+            if not segments:
+                continue
+            if any(char in prefix for char in '*?['):
+                wildcard_dir_patterns.append(prefix)
+                continue
+            node = self._excluded_dir_trie
+            for segment in segments:
+                node = node.setdefault(segment, {})
+            node[_TRIE_END] = True
+        self._excluded_dir_re = _compile_fnmatch(wildcard_dir_patterns)
+        
+        # Exclude patterns are fixed for the lifetime of the manager, so the
+        # decision for a directory is memoized and shared by all its files
+        self._is_pruned_dir = functools.lru_cache(maxsize=4096)(self._is_pruned_dir)
+        
+        # All patterns apply to the relative path; those without a separator
+        # also apply to the bare filename
+        self._exclude_path_re = _compile_fnmatch(self.all_exclude_patterns)
+        self._exclude_name_re = _compile_fnmatch([
+            pattern for pattern in self.all_exclude_patterns if '/' not in pattern
+        ])
+        # Per-pattern matchers, used to name the pattern responsible for an exclusion
+        self._exclude_matchers: List[Tuple[str, Callable[[str], Any]]] = [
+            (pattern, re.compile(fnmatch.translate(os.path.normcase(pattern))).match)
+            for pattern in self.all_exclude_patterns
+        ]
+        
+        # Included project files from a single scandir walk, built lazily
+        self._walk_cache: Optional[List[Tuple[str, os.DirEntry]]] = None
+        
+        # File lists derived from the cached walk (in walk order, sorted on return
+        # when asked), keyed by finder; cleared together with the walk
+        self._file_list_cache: Dict[Tuple[str, ...], List[Path]] = {}
+        
+        # Recently read file contents keyed by path, validated by mtime and size
+        self._content_cache: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._content_cache_size = 0
+        self._content_lock = threading.Lock()
+        
+        # Directories already created for backups and writes
+        self._created_dirs: Set[Path] = set()
+        
+        # Root prefix for slicing relative paths out of absolute path strings
+        self._root_str = str(project_path)
+        self._root_len = len(self._root_str) + (0 if self._root_str.endswith(os.sep) else len(os.sep))
+        
         self.logger.info(f"File manager initialized for project: {project_path}")
         self.logger.debug(f"Exclude patterns: {self.all_exclude_patterns}")
     
-    def find_rust_files(self) -> List[Path]:
+    def find_rust_files(self, sort: bool = True) -> List[Path]:
         """
         Find all Rust source files in the project
         
+        Args:
+            sort: Sort the result by path; pass False when order doesn't matter
+            
         Returns:
             List of paths to Rust files
         """
-        rust_files = []
-        
         try:
-            # Search for .rs files recursively
-            for rust_file in self.project_path.rglob("*.rs"):
-                if self._should_include_file(rust_file):
-                    rust_files.append(rust_file)
+            rust_files = self._file_list_cache.get(('rust',))
+            if rust_files is None:
+                rust_files = list(self.iter_rust_files())
+                self._file_list_cache[('rust',)] = rust_files
             
             self.logger.info(f"Found {len(rust_files)} Rust files")
-            return sorted(rust_files)
+            return sorted(rust_files) if sort else list(rust_files)
             
         except Exception as e:
             self.logger.error(f"Error finding Rust files: {e}", exc_info=True)
             return []
     
-    def find_cargo_files(self) -> List[Path]:
+    def find_cargo_files(self, sort: bool = True) -> List[Path]:
         """
         Find all Cargo-related files in the project
         
+        Args:
+            sort: Sort the result by path; pass False when order doesn't matter
+            
         Returns:
             List of paths to Cargo files
         """
-        cargo_files = []
-        
         try:
-            # Look for Cargo.toml files
-            for cargo_file in self.project_path.rglob("Cargo.toml"):
-                if self._should_include_file(cargo_file):
-                    cargo_files.append(cargo_file)
-            
-            # Look for Cargo.lock files
-            for lock_file in self.project_path.rglob("Cargo.lock"):
-                if self._should_include_file(lock_file):
-                    cargo_files.append(lock_file)
+            cargo_files = list(self.iter_cargo_files())
             
             self.logger.info(f"Found {len(cargo_files)} Cargo files")
-            return sorted(cargo_files)
+            return sorted(cargo_files) if sort else cargo_files
             
         except Exception as e:
             self.logger.error(f"Error finding Cargo files: {e}", exc_info=True)
@@ -134,12 +349,18 @@ class FileManager:
             Path to Cargo.toml or None if not found
         """
         try:
-            # Check case-insensitive using iterdir to get actual filename
+            # The canonical spelling costs a single stat
+            candidate = self.project_path / "Cargo.toml"
+            if candidate.is_file():
+                return candidate
+            
+            # Check case-insensitive using scandir to get actual filename
             if self.project_path.exists():
-                for file_path in self.project_path.iterdir():
-                    if file_path.is_file() and file_path.name.lower() == "cargo.toml":
-                        self.logger.debug(f"Found Cargo.toml: {file_path.name}")
-                        return file_path
+                with os.scandir(self.project_path) as entries:
+                    for entry in entries:
+                        if entry.name.lower() == "cargo.toml" and entry.is_file():
+                            self.logger.debug(f"Found Cargo.toml: {entry.name}")
+                            return Path(entry.path)
             
             return None
             
@@ -147,48 +368,76 @@ class FileManager:
             self.logger.error(f"Error finding Cargo.toml: {e}")
             return None
 
-    def find_config_files(self) -> List[Path]:
+    def find_config_files(self, sort: bool = True) -> List[Path]:
         """
         Find configuration files that might need migration
         
+        Args:
+            sort: Sort the result by path; pass False when order doesn't matter
+            
         Returns:
             List of paths to configuration files
         """
-        config_files = []
-        config_extensions = ['.toml', '.yaml', '.yml', '.json']
-        
         try:
-            for ext in config_extensions:
-                for config_file in self.project_path.rglob(f"*{ext}"):
-                    if self._should_include_file(config_file):
-                        config_files.append(config_file)
+            config_files = list(self.iter_config_files())
             
             self.logger.info(f"Found {len(config_files)} configuration files")
-            return sorted(config_files)
+            return sorted(config_files) if sort else config_files
             
         except Exception as e:
             self.logger.error(f"Error finding configuration files: {e}", exc_info=True)
             return []
     
-    def find_files_by_pattern(self, pattern: str) -> List[Path]:
+    def iter_rust_files(self) -> Iterator[Path]:
+        """
+        Iterate over Rust source files in walk order, without sorting
+        
+        Yields:
+            Paths to Rust files
+        """
+        return (Path(entry.path) for _, entry in self._iter_walk() if entry.name.endswith('.rs'))
+    
+    def iter_cargo_files(self) -> Iterator[Path]:
+        """
+        Iterate over Cargo.toml and Cargo.lock files in walk order, without sorting
+        
+        Yields:
+            Paths to Cargo files
+        """
+        return (Path(entry.path) for _, entry in self._iter_walk() if entry.name in _CARGO_NAMES)
+    
+    def iter_config_files(self) -> Iterator[Path]:
+        """
+        Iterate over configuration files in walk order, without sorting
+        
+        Yields:
+            Paths to configuration files
+        """
+        return (Path(entry.path) for _, entry in self._iter_walk() if entry.name.endswith(_CONFIG_SUFFIXES))
+    
+    def find_files_by_pattern(self, pattern: str, sort: bool = True) -> List[Path]:
         """
         Find files matching a specific pattern
         
         Args:
             pattern: Glob pattern to match files
+            sort: Sort the result by path; pass False when order doesn't matter
             
         Returns:
             List of matching file paths
         """
-        matching_files = []
-        
         try:
-            for file_path in self.project_path.rglob(pattern):
-                if file_path.is_file() and self._should_include_file(file_path):
-                    matching_files.append(file_path)
+            matching_files = self._file_list_cache.get(('pattern', pattern))
+            if matching_files is None:
+                pattern_re = _compile_rglob(pattern)
+                matching_files = [
+                    Path(entry.path) for relative_str, entry in self._walk() if pattern_re.fullmatch(relative_str)
+                ]
+                self._file_list_cache[('pattern', pattern)] = matching_files
             
-            self.logger.debug(f"Found {len(matching_files)} files matching pattern '{pattern}'")
-            return sorted(matching_files)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Found {len(matching_files)} files matching pattern '{pattern}'")
+            return sorted(matching_files) if sort else list(matching_files)
             
         except Exception as e:
             self.logger.error(f"Error finding files with pattern '{pattern}': {e}", exc_info=True)
@@ -221,15 +470,9 @@ class FileManager:
         Returns:
             List of FileInfo objects
         """
-        all_files = []
-        
         try:
-            # Get all files recursively
-            for file_path in self.project_path.rglob("*"):
-                if file_path.is_file() and self._should_include_file(file_path):
-                    file_info = self.get_file_info(file_path)
-                    if file_info:
-                        all_files.append(file_info)
+            # The walk's DirEntry objects already carry the stat for each file
+            all_files = [FileInfo.from_entry(entry, relative_str) for relative_str, entry in self._walk()]
             
             self.logger.info(f"Found {len(all_files)} project files")
             return sorted(all_files, key=lambda f: f.relative_path)
@@ -238,6 +481,134 @@ class FileManager:
             self.logger.error(f"Error getting project files: {e}", exc_info=True)
             return []
     
+    def _walk(self) -> List[Tuple[str, os.DirEntry]]:
+        """
+        Walk the project once with os.scandir and cache the included files
+        
+        Returns:
+            List of (relative path with '/' separators, DirEntry) tuples
+        """
+        if self._walk_cache is None:
+            self._walk_cache = list(self._scan())
+        return self._walk_cache
+    
+    def _iter_walk(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Stream the included files, from the cache or while scanning
+        
+        A scan that runs to completion fills the cache used by _walk.
+        
+        Yields:
+            (relative path with '/' separators, DirEntry) tuples
+        """
+        if self._walk_cache is not None:
+            yield from self._walk_cache
+            return
+        
+        files: List[Tuple[str, os.DirEntry]] = []
+        for item in self._scan():
+            files.append(item)
+            yield item
+        self._walk_cache = files
+    
+    def _scan(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Scan the project tree with os.scandir
+        
+        Excluded directories are pruned instead of descended into, and
+        symlinked directories are not followed (matching ``Path.rglob``).
+        
+        Yields:
+            (relative path with '/' separators, DirEntry) tuples of included files
+        """
+        root = str(self.project_path)
+        stack: List[Tuple[str, str, Optional[Dict[str, Any]]]] = [(root, '', self._excluded_dir_trie)]
+        
+        while stack:
+            directory, relative_dir, trie_node = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        relative_str = f"{relative_dir}{entry.name}"
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                child_node = trie_node.get(os.path.normcase(entry.name)) if trie_node else None
+                                if child_node is not None and _TRIE_END in child_node:
+                                    self._record_excluded_dir(relative_str)
+                                elif not self._is_excluded_dir(relative_str):
+                                    stack.append((entry.path, relative_str + '/', child_node))
+                                continue
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        
+                        if self._is_included(relative_str, entry.name):
+                            yield relative_str, entry
+            except OSError as e:
+                self.logger.warning(f"Cannot scan directory {directory}: {e}")
+    
+    def _is_pruned_dir(self, relative_dir: str) -> bool:
+        """
+        Check if a whole directory is excluded, via the trie or a wildcard pattern
+        
+        Args:
+            relative_dir: Directory path relative to the project root
+            
+        Returns:
+            True if every file below the directory is excluded
+        """
+        node = self._excluded_dir_trie
+        segments = relative_dir.split('/')
+        for index, segment in enumerate(segments):
+            node = node.get(os.path.normcase(segment))
+            if node is None:
+                break
+            if _TRIE_END in node:
+                self._record_excluded_dir('/'.join(segments[:index + 1]))
+                return True
+        return self._is_excluded_dir(relative_dir)
+    
+    def _is_excluded_dir(self, relative_dir: str) -> bool:
+        """
+        Check if a whole directory is excluded by a wildcard "X/**" pattern
+        
+        Args:
+            relative_dir: Directory path relative to the project root
+            
+        Returns:
+            True if every file below the directory is excluded
+        """
+        if self._excluded_dir_re is None or not self._excluded_dir_re.match(os.path.normcase(relative_dir)):
+            return False
+        
+        self._record_excluded_dir(relative_dir)
+        return True
+    
+    def _record_excluded_dir(self, relative_dir: str) -> None:
+        """Log an excluded directory once and remember it for later inclusion checks"""
+        if relative_dir not in self._logged_exclusions:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Excluding directory {relative_dir}")
+            self._logged_exclusions.add(relative_dir)
+    
+    def invalidate_cache(self) -> None:
+        """Forget the cached project walk and created directories so the next lookup rescans the tree"""
+        self._walk_cache = None
+        self._file_list_cache.clear()
+        self._created_dirs.clear()
+    
+    def _ensure_dir(self, directory: Path) -> None:
+        """
+        Create a directory and its parents once per file manager
+        
+        Args:
+            directory: Directory that must exist
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
     def _should_include_file(self, file_path: Path) -> bool:
         """
         Check if a file should be included based on exclude patterns
@@ -249,59 +620,119 @@ class FileManager:
             True if file should be included, False otherwise
         """
         try:
-            # Get relative path for pattern matching
-            relative_path = file_path.relative_to(self.project_path)
-            relative_str = str(relative_path).replace('\\', '/')  # Normalize path separators
-
-            # 1. Check if any parent directory was already logged as excluded
-            # This dramatically reduces log noise for excluded folders
-            for parent in relative_path.parents:
-                parent_str = str(parent).replace('\\', '/')
-                if parent_str != '.' and parent_str in self._logged_exclusions:
-                    return False
-            
-            # 2. Check against exclude patterns
-            for pattern in self.all_exclude_patterns:
-                matched = False
-                match_type = ""
-                
-                if fnmatch.fnmatch(relative_str, pattern):
-                    matched = True
-                    match_type = "matches pattern"
-                elif fnmatch.fnmatch(file_path.name, pattern):
-                    matched = True
-                    match_type = "filename matches pattern"
-                
-                if matched:
-                    # Determine what to log
-                    log_path = relative_str
-                    log_target = "file"
-                    
-                    # If it looks like a directory-style exclusion, try to log the directory once
-                    if '/**' in pattern or '/' in pattern:
-                        parts = relative_str.split('/')
-                        # Check path parts to see if any of them (as directories) trigger the exclusion
-                        for i in range(len(parts)):
-                            check_path = '/'.join(parts[:i+1])
-                            # If this sub-path matches the pattern or any placeholder under it matches
-                            if fnmatch.fnmatch(check_path, pattern) or fnmatch.fnmatch(check_path + "/placeholder", pattern):
-                                log_path = check_path
-                                log_target = "directory"
-                                break
-                    
-                    # Log only if we haven't logged this path (or a parent) yet
-                    if log_path != '.' and log_path not in self._logged_exclusions:
-                        self.logger.debug(f"Excluding {log_target} {log_path} ({match_type}: {pattern})")
-                        self._logged_exclusions.add(log_path)
-                    
-                    return False
-            
-            return True
-            
+            return self._is_included(self._relative_str(file_path), file_path.name)
         except Exception as e:
             self.logger.warning(f"Error checking file inclusion for {file_path}: {e}")
             return False
     
+    def is_excluded(self, relative_path: str) -> bool:
+        """
+        Check a project-relative path against the compiled exclude patterns
+        
+        Args:
+            relative_path: Path relative to the project root
+            
+        Returns:
+            True if the path is excluded, False otherwise
+        """
+        relative_str = relative_path.replace(os.sep, '/') if os.sep != '/' else relative_path
+        return not self._is_included(relative_str, relative_str.rpartition('/')[2])
+    
+    def _relative_str(self, file_path: Path) -> str:
+        """
+        Get a file's path relative to the project root with '/' separators
+        
+        Args:
+            file_path: Path inside the project
+            
+        Returns:
+            Relative path string
+        """
+        path_str = str(file_path)
+        if path_str.startswith(self._root_str) and path_str[self._root_len - len(os.sep):self._root_len] == os.sep:
+            relative_str = path_str[self._root_len:]
+        else:
+            relative_str = str(file_path.relative_to(self.project_path))
+        if os.sep != '/':
+            relative_str = relative_str.replace(os.sep, '/')  # Normalize path separators
+        return relative_str
+    
+    def _is_included(self, relative_str: str, name: str) -> bool:
+        """
+        Check a relative path against the exclude patterns
+        
+        Args:
+            relative_str: Path relative to the project root with '/' separators
+            name: Filename of the path
+            
+        Returns:
+            True if the file should be included, False otherwise
+        """
+        # 1. Files inside a directory excluded as a whole need no pattern matching
+        parent = relative_str.rpartition('/')[0]
+        if parent and self._is_pruned_dir(parent):
+            return False
+        
+        # 2. Check if any parent directory was already logged as excluded
+        # This dramatically reduces log noise for excluded folders
+        separator = relative_str.find('/')
+        while separator != -1:
+            if relative_str[:separator] in self._logged_exclusions:
+                return False
+            separator = relative_str.find('/', separator + 1)
+        
+        # 3. Check against all exclude patterns at once
+        path_excluded = (
+            self._exclude_path_re is not None
+            and self._exclude_path_re.match(os.path.normcase(relative_str))
+        )
+        name_excluded = (
+            self._exclude_name_re is not None
+            and self._exclude_name_re.match(os.path.normcase(name))
+        )
+        if not (path_excluded or name_excluded):
+            return True
+        
+        # 4. Find the responsible pattern so the exclusion is recorded once
+        for pattern, pattern_match in self._exclude_matchers:
+            matched = False
+            match_type = ""
+            
+            if pattern_match(os.path.normcase(relative_str)):
+                matched = True
+                match_type = "matches pattern"
+            elif pattern_match(os.path.normcase(name)):
+                matched = True
+                match_type = "filename matches pattern"
+            
+            if matched:
+                # Determine what to log
+                log_path = relative_str
+                log_target = "file"
+                
+                # If it looks like a directory-style exclusion, try to log the directory once
+                if '/**' in pattern or '/' in pattern:
+                    parts = relative_str.split('/')
+                    # Check path parts to see if any of them (as directories) trigger the exclusion
+                    for i in range(len(parts)):
+                        check_path = '/'.join(parts[:i+1])
+                        # If this sub-path matches the pattern or any placeholder under it matches
+                        normalized = os.path.normcase(check_path)
+                        if pattern_match(normalized) or pattern_match(normalized + "/placeholder"):
+                            log_path = check_path
+                            log_target = "directory"
+                            break
+                
+                # Log only if we haven't logged this path (or a parent) yet
+                if log_path != '.' and log_path not in self._logged_exclusions:
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Excluding {log_target} {log_path} ({match_type}: {pattern})")
+                    self._logged_exclusions.add(log_path)
+                
+                return False
+        
+        return True
+    
     def backup_file(self, file_path: Path, backup_dir: Path) -> Optional[Path]:
         """
         Create a backup of a file
@@ -321,19 +752,69 @@ class FileManager:
             # Create backup directory structure
             relative_path = file_path.relative_to(self.project_path)
             backup_file_path = backup_dir / relative_path
-            backup_file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(backup_file_path.parent)
+            
+            # Copies keep the source's mtime, so a backup with the same size and
+            # mtime is already up to date (e.g. when a step is re-run)
+            try:
+                source_stat = file_path.stat()
+                backup_stat = backup_file_path.stat()
+                if (backup_stat.st_size == source_stat.st_size
+                        and backup_stat.st_mtime_ns == source_stat.st_mtime_ns):
+                    return backup_file_path
+            except FileNotFoundError:
+                pass
             
             # Copy the file
-            import shutil
-            shutil.copy2(file_path, backup_file_path)
+            self.copy_file(file_path, backup_file_path)
             
-            self.logger.debug(f"Backed up file: {file_path} -> {backup_file_path}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Backed up file: {file_path} -> {backup_file_path}")
             return backup_file_path
             
         except Exception as e:
             self.logger.error(f"Failed to backup file {file_path}: {e}", exc_info=True)
             return None
     
+    def backup_files(self, file_paths: List[Path], backup_dir: Path) -> List[Optional[Path]]:
+        """
+        Back up several files, concurrently for larger batches
+        
+        Args:
+            file_paths: Paths of the files to backup
+            backup_dir: Directory to store the backups
+            
+        Returns:
+            Backup path (or None if that backup failed) for each file, in input order
+        """
+        return self._map_files(lambda file_path: self.backup_file(file_path, backup_dir), file_paths)
+    
+    def copy_file(self, source: Path, destination: Path) -> None:
+        """
+        Copy a file with its metadata, letting the kernel do the copy when possible
+        
+        On Linux a FICLONE reflink shares the source's extents on copy-on-write
+        filesystems. os.copy_file_range copies without passing data through
+        user space; os.sendfile covers kernels that refuse copy_file_range for
+        the pair (e.g. across filesystems), and anything else falls back to
+        shutil.copy2.
+        
+        Args:
+            source: File to copy
+            destination: Path of the copy
+        """
+        for kernel_copy in _KERNEL_COPIES:
+            try:
+                with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                    while kernel_copy(src.fileno(), dst.fileno(), 1 << 30) > 0:
+                        pass
+                shutil.copystat(source, destination)
+                return
+            except OSError:
+                continue
+        
+        shutil.copy2(source, destination)
+    
     def restore_file(self, backup_path: Path, original_path: Path) -> bool:
         """
         Restore a file from backup
@@ -351,10 +832,12 @@ class FileManager:
                 return False
             
             # Create parent directory if needed
-            original_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(original_path.parent)
             
             # Copy the backup back
-            import shutil
+            if not original_path.exists():
+                self.invalidate_cache()
+            self._forget_content(str(original_path))
             shutil.copy2(backup_path, original_path)
             
             self.logger.info(f"Restored file: {backup_path} -> {original_path}")
@@ -375,12 +858,33 @@ class FileManager:
             File content as string or None if read failed
         """
         try:
-            if not file_path.exists():
+            try:
+                stat = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 self.logger.warning(f"Cannot read non-existent file: {file_path}")
                 return None
             
-            content = file_path.read_text(encoding='utf-8')
-            self.logger.debug(f"Read file content: {file_path} ({len(content)} characters)")
+            key = str(file_path)
+            with self._content_lock:
+                cached = self._content_cache.get(key)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    self._content_cache.move_to_end(key)
+                    return cached[2]
+            
+            data = file_path.read_bytes()
+            if b'\0' in data[:_BINARY_SNIFF_SIZE]:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"File {file_path} looks binary, skipping")
+                return None
+            
+            # Same result as read_text: strict UTF-8 with universal newlines
+            content = data.decode('utf-8')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Read file content: {file_path} ({len(content)} characters)")
+            self._cache_content(key, stat.st_mtime_ns, stat.st_size, content)
             return content
             
         except UnicodeDecodeError:
@@ -390,6 +894,63 @@ class FileManager:
             self.logger.error(f"Failed to read file {file_path}: {e}", exc_info=True)
             return None
     
+    def read_file_bytes(self, file_path: Path) -> Optional[bytes]:
+        """
+        Read the raw content of a file without decoding it
+        
+        Args:
+            file_path: Path to the file to read
+            
+        Returns:
+            File content as bytes or None if read failed
+        """
+        try:
+            return file_path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            self.logger.warning(f"Cannot read non-existent file: {file_path}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Failed to read file {file_path}: {e}", exc_info=True)
+            return None
+    
+    def _cache_content(self, key: str, mtime_ns: int, size: int, content: str) -> None:
+        """Remember file content, evicting the least recently read entries over the limit"""
+        self._forget_content(key)
+        if len(content) > self.CONTENT_CACHE_LIMIT:
+            return
+        
+        with self._content_lock:
+            self._content_cache[key] = (mtime_ns, size, content)
+            self._content_cache_size += len(content)
+            while self._content_cache_size > self.CONTENT_CACHE_LIMIT:
+                _, (_, _, evicted) = self._content_cache.popitem(last=False)
+                self._content_cache_size -= len(evicted)
+    
+    def _forget_content(self, key: str) -> None:
+        """Drop a cached file content"""
+        with self._content_lock:
+            cached = self._content_cache.pop(key, None)
+            if cached is not None:
+                self._content_cache_size -= len(cached[2])
+    
+    def _map_files(self, func: Callable[[Path], Any], file_paths: List[Path]) -> List[Any]:
+        """
+        Apply an I/O-bound function to each file, concurrently for larger batches
+        
+        Args:
+            func: Function to call for each file
+            file_paths: Files to process
+            
+        Returns:
+            Results in the same order as file_paths
+        """
+        workers = min(self.max_workers, len(file_paths))
+        if len(file_paths) < self.PARALLEL_THRESHOLD or workers <= 1:
+            return [func(file_path) for file_path in file_paths]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, file_paths))
+    
     def write_file_content(self, file_path: Path, content: str, create_backup: bool = True) -> bool:
         """
         Write content to a file
@@ -409,12 +970,18 @@ class FileManager:
                 self.backup_file(file_path, backup_dir)
             
             # Create parent directory if needed
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(file_path.parent)
+            
+            # A new file changes the project tree
+            if not file_path.exists():
+                self.invalidate_cache()
             
             # Write the content
+            self._forget_content(str(file_path))
             file_path.write_text(content, encoding='utf-8')
             
-            self.logger.debug(f"Wrote file content: {file_path} ({len(content)} characters)")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Wrote file content: {file_path} ({len(content)} characters)")
             return True
             
         except Exception as e:
@@ -429,23 +996,42 @@ class FileManager:
             Dictionary with file statistics
         """
         try:
-            rust_files = self.find_rust_files()
-            cargo_files = self.find_cargo_files()
-            config_files = self.find_config_files()
-            all_files = self.get_project_files()
+            total_files = rust_files = cargo_files = config_files = 0
+            total_size = rust_size = 0
+            largest: Optional[Tuple[int, str, os.DirEntry]] = None
             
-            total_size = sum(f.size for f in all_files)
-            rust_size = sum(f.size for f in all_files if f.is_rust_file)
+            # Single streamed pass over the walk, using the DirEntry stat
+            for relative_str, entry in self._iter_walk():
+                name = entry.name
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                
+                total_files += 1
+                total_size += size
+                if name.endswith('.rs'):
+                    rust_files += 1
+                    rust_size += size
+                if name in _CARGO_NAMES:
+                    cargo_files += 1
+                if name.endswith(_CONFIG_SUFFIXES):
+                    config_files += 1
+                
+                # Ties go to the first file in path order, as with a sorted scan
+                if (largest is None or size > largest[0]
+                        or (size == largest[0] and Path(relative_str) < Path(largest[1]))):
+                    largest = (size, relative_str, entry)
             
             return {
-                "total_files": len(all_files),
-                "rust_files": len(rust_files),
-                "cargo_files": len(cargo_files),
-                "config_files": len(config_files),
+                "total_files": total_files,
+                "rust_files": rust_files,
+                "cargo_files": cargo_files,
+                "config_files": config_files,
                 "total_size_bytes": total_size,
                 "rust_size_bytes": rust_size,
-                "average_file_size": total_size / len(all_files) if all_files else 0,
-                "largest_file": max(all_files, key=lambda f: f.size) if all_files else None,
+                "average_file_size": total_size / total_files if total_files else 0,
+                "largest_file": FileInfo.from_entry(largest[2], largest[1]) if largest else None,
                 "exclude_patterns": self.all_exclude_patterns
             }
             
@@ -463,32 +1049,38 @@ class FileManager:
         Returns:
             Dictionary mapping file paths to access status
         """
-        access_status = {}
-        
-        for file_path in file_paths:
-            try:
-                # Check if file exists and is readable
-                if not file_path.exists():
-                    access_status[file_path] = False
-                    continue
-                
-                # Try to read the file
-                content = self.read_file_content(file_path)
-                if content is None:
-                    access_status[file_path] = False
-                    continue
-                
-                # Check if file is writable (try to open in append mode)
-                with open(file_path, 'a', encoding='utf-8'):
-                    pass
-                
-                access_status[file_path] = True
-                
-            except Exception as e:
-                self.logger.warning(f"File access validation failed for {file_path}: {e}")
-                access_status[file_path] = False
+        results = self._map_files(self._validate_access, file_paths)
+        return dict(zip(file_paths, results))
+    
+    def _validate_access(self, file_path: Path) -> bool:
+        """
+        Check that a single file can be read and written
         
-        return access_status
+        Args:
+            file_path: Path to validate
+            
+        Returns:
+            True if the file is readable text and writable
+        """
+        try:
+            # Check if file exists and is readable
+            if not file_path.exists():
+                return False
+            
+            # Try to read the file
+            content = self.read_file_content(file_path)
+            if content is None:
+                return False
+            
+            # Check if file is writable (try to open in append mode)
+            with open(file_path, 'a', encoding='utf-8'):
+                pass
+            
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"File access validation failed for {file_path}: {e}")
+            return False
     
     def find_files_containing_pattern(self, pattern: str, file_types: Optional[List[str]] = None) -> List[Path]:
         """
@@ -501,33 +1093,92 @@ class FileManager:
         Returns:
             List of file paths containing the pattern
         """
-        matching_files = []
+        return self.find_files_containing_patterns([pattern], file_types)
+    
+    def find_files_containing_patterns(self, patterns: List[str], file_types: Optional[List[str]] = None) -> List[Path]:
+        """
+        Find files containing any of several text patterns in a single pass
+        
+        Args:
+            patterns: Text patterns to search for
+            file_types: List of file extensions to search in (e.g., ['.rs', '.toml'])
+            
+        Returns:
+            List of file paths containing at least one of the patterns
+        """
+        description = f"pattern '{patterns[0]}'" if len(patterns) == 1 else f"patterns {patterns}"
         
         try:
+            if not patterns:
+                return []
+            
             # Default to Rust files if no types specified
             if file_types is None:
                 file_types = ['.rs']
+            suffixes = tuple(file_types)
             
-            # Find all files of specified types
-            for file_type in file_types:
-                for file_path in self.project_path.rglob(f"*{file_type}"):
-                    if not self._should_include_file(file_path):
-                        continue
-                    
-                    content = self.read_file_content(file_path)
-                    if content and pattern in content:
-                        matching_files.append(file_path)
+            # Files are searched as raw bytes, which only works when newline
+            # translation cannot affect a match
+            search_bytes = not any('\r' in pattern or '\n' in pattern for pattern in patterns)
+            needles = [pattern.encode('utf-8') for pattern in patterns] if search_bytes else patterns
+            
+            # One pattern is a plain substring test; several are combined into
+            # a single alternation so each file is scanned once
+            if len(needles) == 1:
+                needle = needles[0]
+                contains = lambda data: data.find(needle) != -1
+            else:
+                separator = b'|' if search_bytes else '|'
+                combined = re.compile(separator.join(re.escape(needle) for needle in needles))
+                contains = lambda data: combined.search(data) is not None
+            
+            def file_matches(file_path: Path) -> bool:
+                if search_bytes:
+                    return self._file_contains(file_path, contains)
+                content = self.read_file_content(file_path)
+                return bool(content) and contains(content)
+            
+            # Search all files of specified types
+            candidates = [Path(entry.path) for _, entry in self._walk() if entry.name.endswith(suffixes)]
+            found = self._map_files(file_matches, candidates)
+            matching_files = [file_path for file_path, matched in zip(candidates, found) if matched]
             
             if matching_files:
-                self.logger.info(f"Found {len(matching_files)} files containing pattern '{pattern}'")
+                self.logger.info(f"Found {len(matching_files)} files containing {description}")
             else:
-                self.logger.debug(f"Found 0 files containing pattern '{pattern}'")
+                self.logger.debug(f"Found 0 files containing {description}")
             return sorted(matching_files)
             
         except Exception as e:
-            self.logger.error(f"Error searching for pattern '{pattern}': {e}", exc_info=True)
+            self.logger.error(f"Error searching for {description}: {e}", exc_info=True)
             return []
     
+    def _file_contains(self, file_path: Path, contains: Callable[[Any], bool]) -> bool:
+        """
+        Search a file's raw bytes through mmap without decoding it
+        
+        Args:
+            file_path: Path to the file to search
+            contains: Predicate applied to the mapped bytes
+            
+        Returns:
+            True if the predicate matched and the file is readable UTF-8 text
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if not contains(data):
+                        return False
+        except ValueError:
+            # Empty files cannot be mapped and contain nothing
+            return False
+        except OSError as e:
+            self.logger.error(f"Failed to read file {file_path}: {e}")
+            return False
+        
+        # Only hits are decoded; callers load them next, so this also warms the content cache
+        return bool(self.read_file_content(file_path))
+    
     def get_directory_structure(self, max_depth: int = 3) -> Dict[str, Any]:
         """
         Get a representation of the project directory structure
@@ -538,35 +1189,57 @@ class FileManager:
         Returns:
             Dictionary representing the directory structure
         """
-        def build_tree(path: Path, current_depth: int) -> Dict[str, Any]:
-            if current_depth > max_depth:
+        try:
+            if max_depth < 0:
                 return {"type": "directory", "truncated": True}
             
-            if path.is_file():
-                file_info = self.get_file_info(path)
-                return {
-                    "type": "file",
-                    "size": file_info.size if file_info else 0,
-                    "is_rust": path.suffix == '.rs',
-                    "is_cargo": path.name in ['Cargo.toml', 'Cargo.lock']
-                }
+            root: Dict[str, Any] = {"type": "directory"}
+            queue = deque([(str(self.project_path), '', 0, root)])
             
-            children = {}
-            try:
-                for child in sorted(path.iterdir()):
-                    if self._should_include_file(child):
-                        children[child.name] = build_tree(child, current_depth + 1)
-            except PermissionError:
-                return {"type": "directory", "error": "Permission denied"}
+            # Breadth-first over directories; each node dict is filled in place
+            while queue:
+                directory, relative_dir, depth, node = queue.popleft()
+                try:
+                    with os.scandir(directory) as it:
+                        entries = sorted(it, key=lambda entry: entry.name)
+                except PermissionError:
+                    node.clear()
+                    node.update({"type": "directory", "error": "Permission denied"})
+                    continue
+                
+                children: Dict[str, Any] = {}
+                for entry in entries:
+                    name = entry.name
+                    relative_str = f"{relative_dir}{name}"
+                    if not self._is_included(relative_str, name):
+                        continue
+                    
+                    if depth + 1 > max_depth:
+                        children[name] = {"type": "directory", "truncated": True}
+                    elif entry.is_file():
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = 0
+                        children[name] = {
+                            "type": "file",
+                            "size": size,
+                            "is_rust": _suffix(name) == '.rs',
+                            "is_cargo": name in _CARGO_NAMES
+                        }
+                    else:
+                        child: Dict[str, Any] = {"type": "directory"}
+                        children[name] = child
+                        if self._is_pruned_dir(relative_str):
+                            # Every descendant is excluded, no need to scan it
+                            child.update({"children": {}, "child_count": 0})
+                        else:
+                            queue.append((entry.path, relative_str + '/', depth + 1, child))
+                
+                node["children"] = children
+                node["child_count"] = len(children)
             
-            return {
-                "type": "directory",
-                "children": children,
-                "child_count": len(children)
-            }
-        
-        try:
-            return build_tree(self.project_path, 0)
+            return root
         except Exception as e:
             self.logger.error(f"Failed to build directory structure: {e}", exc_info=True)
-            return {"type": "directory", "error": str(e)}
\ No newline at end of file
+            return {"type": "directory", "error": str(e)}
@@ -3,25 +3,133 @@ Migration Engine - Core component for managing Bevy version migrations
 Handles the orchestration of migration steps and coordination between modules
 """
 
+import functools
+import importlib
 import logging
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
 from datetime import datetime
+from enum import IntEnum
 
 from bevymigrate.migrations.base_migration import BaseMigration
-from bevymigrate.migrations.v0_12_to_0_13 import Migration_0_12_to_0_13
-from bevymigrate.migrations.v0_13_to_0_14 import Migration_0_13_to_0_14
-from bevymigrate.migrations.v0_14_to_0_15_part1 import Migration_0_14_to_0_15_Part1
-from bevymigrate.migrations.v0_14_to_0_15_part2 import Migration_0_14_to_0_15_Part2
-from bevymigrate.migrations.v0_15_to_0_16 import Migration_0_15_to_0_16
-from bevymigrate.migrations.v0_16_to_0_17_part1 import Migration_0_16_to_0_17_Part1
-from bevymigrate.migrations.v0_16_to_0_17_part2 import Migration_0_16_to_0_17_Part2
-from bevymigrate.migrations.v0_16_to_0_17_part3 import Migration_0_16_to_0_17_Part3
-from bevymigrate.migrations.v0_17_to_0_18 import Migration_0_17_to_0_18
-from bevymigrate.migrations.v0_18_to_0_19_part1 import Migration_0_18_to_0_19_Part1
 from bevymigrate.core.file_manager import FileManager
-from bevymigrate.utils.version_detector import VersionDetector
+from bevymigrate.utils.file_io import write_text_atomic
+from bevymigrate.utils.version_detector import VersionDetector, invalidate_cargo_cache, read_cargo_toml
+
+
+# Bevy dependency declaration in Cargo.toml whose version gets rewritten, either
+# bevy = "0.15" / bevy = '0.15' or bevy = { version = "0.15" }
+_BEVY_VERSION_RE = re.compile(r'(\bbevy\s*=\s*(?:\{[^}]*version\s*=\s*)?["\'])[^"\']*(["\'])')
+
+# Any mention of Bevy, matched without lowercasing a copy of the manifest
+_BEVY_MENTION_RE = re.compile('bevy', re.IGNORECASE)
+
+
+# Versions a migration can start from or end at, in release order
+_SUPPORTED_VERSIONS: Tuple[str, ...] = ("0.12", "0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "0.19-part1")
+
+
+class BevyVersion(IntEnum):
+    """Supported Bevy versions; members compare in release order"""
+    V0_12 = 0
+    V0_13 = 1
+    V0_14 = 2
+    V0_15 = 3
+    V0_16 = 4
+    V0_17 = 5
+    V0_18 = 6
+    V0_19_PART1 = 7
+    
+    @classmethod
+    def parse(cls, version: str) -> "BevyVersion":
+        """
+        Look up the member for a version string
+        
+        Args:
+            version: Version string such as "0.15" or "0.19-part1"
+            
+        Returns:
+            The matching BevyVersion
+            
+        Raises:
+            ValueError: If the version is not supported
+        """
+        try:
+            return _VERSIONS_BY_LABEL[version]
+        except KeyError:
+            raise ValueError(f"Unsupported Bevy version: {version}") from None
+    
+    @property
+    def label(self) -> str:
+        """Version string of this member, such as 0.19-part1"""
+        return _SUPPORTED_VERSIONS[self]
+
+
+_VERSIONS_BY_LABEL: Dict[str, BevyVersion] = {label: BevyVersion(index) for index, label in enumerate(_SUPPORTED_VERSIONS)}
+
+
+# Version progression mapping
+_VERSION_PROGRESSION: Dict[str, str] = {
+    "0.12": "0.13",
+    "0.13": "0.14",
+    "0.14": "0.15-part1",
+    "0.15-part1": "0.15",
+    "0.15": "0.16",
+    "0.16": "0.17-part1",
+    "0.17-part1": "0.17-part2",
+    "0.17-part2": "0.17",
+    "0.17": "0.18",
+    "0.18": "0.19-part1"
+}
+
+
+# A migration step: (from_version, to_version, registry key "from->to")
+MigrationStep = Tuple[str, str, str]
+
+
+def _precompute_paths(progression: Dict[str, str]) -> Dict[Tuple[str, str], Tuple[MigrationStep, ...]]:
+    """
+    Walk the version progression once from every version
+    
+    Args:
+        progression: Mapping of each version to the version it migrates to
+        
+    Returns:
+        Migration steps for every reachable (from_version, to_version) pair
+    """
+    paths: Dict[Tuple[str, str], Tuple[MigrationStep, ...]] = {}
+    for start in progression:
+        path: List[MigrationStep] = []
+        current_version = start
+        # A walk longer than the progression itself would be going round a cycle
+        while current_version in progression and len(path) < len(progression):
+            next_version = progression[current_version]
+            path.append((current_version, next_version, f"{current_version}->{next_version}"))
+            paths.setdefault((start, next_version), tuple(path))
+            current_version = next_version
+    return paths
+
+
+_MIGRATION_PATHS = _precompute_paths(_VERSION_PROGRESSION)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_migration_class(spec: str) -> Type[BaseMigration]:
+    """
+    Import a migration class on first use
+    
+    Args:
+        spec: "module:ClassName" reference to the migration class
+        
+    Returns:
+        The migration class
+    """
+    module_name, class_name = spec.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class MigrationEngine:
@@ -34,7 +142,8 @@ class MigrationEngine:
         project_path: Path,
         backup_dir: Optional[Path] = None,
         dry_run: bool = False,
-        exclude_patterns: Optional[List[str]] = None
+        exclude_patterns: Optional[List[str]] = None,
+        use_cache: bool = True
     ):
         """
         Initialize the migration engine
@@ -44,43 +153,34 @@ class MigrationEngine:
             backup_dir: Directory to store backups (optional)
             dry_run: If True, only show what would be changed
             exclude_patterns: List of file/directory patterns to exclude
+            use_cache: If True, migrations reuse transformation results cached by earlier runs
         """
         self.project_path = project_path
         self.backup_dir = backup_dir or (project_path / "migration_backup")
         self.dry_run = dry_run
         self.exclude_patterns = exclude_patterns or []
+        self.use_cache = use_cache
         
         self.logger = logging.getLogger(__name__)
         self.file_manager = FileManager(project_path, exclude_patterns)
         self.version_detector = VersionDetector()
         
-        # Registry of available migrations
-        self._migration_registry: Dict[str, Type[BaseMigration]] = {
-            "0.12->0.13": Migration_0_12_to_0_13,
-            "0.13->0.14": Migration_0_13_to_0_14,
-            "0.14->0.15-part1": Migration_0_14_to_0_15_Part1,
-            "0.15-part1->0.15": Migration_0_14_to_0_15_Part2,
-            "0.15->0.16": Migration_0_15_to_0_16,
-            "0.16->0.17-part1": Migration_0_16_to_0_17_Part1,
-            "0.17-part1->0.17-part2": Migration_0_16_to_0_17_Part2,
-            "0.17-part2->0.17": Migration_0_16_to_0_17_Part3,
-            "0.17->0.18": Migration_0_17_to_0_18,
-            "0.18->0.19-part1": Migration_0_18_to_0_19_Part1,
+        # Registry of available migrations; modules are imported only when a step needs them
+        self._migration_registry: Dict[str, str] = {
+            "0.12->0.13": "bevymigrate.migrations.v0_12_to_0_13:Migration_0_12_to_0_13",
+            "0.13->0.14": "bevymigrate.migrations.v0_13_to_0_14:Migration_0_13_to_0_14",
+            "0.14->0.15-part1": "bevymigrate.migrations.v0_14_to_0_15_part1:Migration_0_14_to_0_15_Part1",
+            "0.15-part1->0.15": "bevymigrate.migrations.v0_14_to_0_15_part2:Migration_0_14_to_0_15_Part2",
+            "0.15->0.16": "bevymigrate.migrations.v0_15_to_0_16:Migration_0_15_to_0_16",
+            "0.16->0.17-part1": "bevymigrate.migrations.v0_16_to_0_17_part1:Migration_0_16_to_0_17_Part1",
+            "0.17-part1->0.17-part2": "bevymigrate.migrations.v0_16_to_0_17_part2:Migration_0_16_to_0_17_Part2",
+            "0.17-part2->0.17": "bevymigrate.migrations.v0_16_to_0_17_part3:Migration_0_16_to_0_17_Part3",
+            "0.17->0.18": "bevymigrate.migrations.v0_17_to_0_18:Migration_0_17_to_0_18",
+            "0.18->0.19-part1": "bevymigrate.migrations.v0_18_to_0_19_part1:Migration_0_18_to_0_19_Part1",
         }
         
-        # Version progression mapping
-        self._version_progression = {
-            "0.12": "0.13",
-            "0.13": "0.14",
-            "0.14": "0.15-part1",
-            "0.15-part1": "0.15",
-            "0.15": "0.16",
-            "0.16": "0.17-part1",
-            "0.17-part1": "0.17-part2",
-            "0.17-part2": "0.17",
-            "0.17": "0.18",
-            "0.18": "0.19-part1"
-        }
+        # Migration instances built so far, keyed by (migration key, dry run)
+        self._migration_cache: Dict[Tuple[str, bool], BaseMigration] = {}
         
         self.logger.info(f"Migration engine initialized for project: {project_path}")
         self.logger.info(f"Dry run mode: {dry_run}")
@@ -104,23 +204,36 @@ class MigrationEngine:
             if not self._validate_versions(from_version, to_version):
                 return False
             
-            # Create backup if not in dry run mode
-            if not self.dry_run:
-                if not self._create_backup():
-                    self.logger.error("Failed to create backup")
-                    return False
-            
             # Get migration path
             migration_steps = self._get_migration_path(from_version, to_version)
             if not migration_steps:
                 self.logger.error(f"No migration path found from {from_version} to {to_version}")
                 return False
             
-            self.logger.info(f"Migration path: {' -> '.join([step[0] for step in migration_steps] + [migration_steps[-1][1]])}")
+            # Steps whose patterns match no project file have nothing to rewrite
+            steps_with_files = {step for step in migration_steps if self._step_has_files(step[2])}
+            
+            # Create backup if not in dry run mode, limited to the files the steps can rewrite;
+            # with no such files and no Cargo.toml to bump there is nothing to back up
+            if not self.dry_run and (steps_with_files or self.file_manager.find_cargo_toml()):
+                if not self._create_backup(patterns=self._get_affected_patterns(steps_with_files)):
+                    self.logger.error("Failed to create backup")
+                    return False
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Migration path: {' -> '.join([step[0] for step in migration_steps] + [migration_steps[-1][1]])}")
             
             # Execute migration steps
-            for step_from, step_to in migration_steps:
-                if not self._execute_migration_step(step_from, step_to):
+            for step in migration_steps:
+                step_from, step_to, migration_key = step
+                if step not in steps_with_files:
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"Step {step_from} -> {step_to}: no matching files, skipping")
+                    if not self.dry_run:
+                        self._update_project_version(step_to)
+                    continue
+                
+                if not self._execute_migration_step(step_from, step_to, migration_key):
                     self.logger.error(f"Migration step {step_from} -> {step_to} failed")
                     return False
             
@@ -133,76 +246,61 @@ class MigrationEngine:
     
     def _validate_versions(self, from_version: str, to_version: str) -> bool:
         """Validate that the version migration is supported"""
-        supported_versions = ["0.12", "0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "0.19-part1"]
-        
-        if from_version not in supported_versions:
+        try:
+            source = BevyVersion.parse(from_version)
+        except ValueError:
             self.logger.error(f"Unsupported source version: {from_version}")
             return False
         
-        if to_version not in supported_versions:
+        try:
+            target = BevyVersion.parse(to_version)
+        except ValueError:
             self.logger.error(f"Unsupported target version: {to_version}")
             return False
         
         # Check version order
-        version_order = {v: i for i, v in enumerate(supported_versions)}
-        if version_order[from_version] >= version_order[to_version]:
+        if source >= target:
             self.logger.error(f"Cannot migrate backwards from {from_version} to {to_version}")
             return False
         
         return True
     
-    def _get_migration_path(self, from_version: str, to_version: str) -> List[tuple]:
+    def _get_migration_path(self, from_version: str, to_version: str) -> Tuple[MigrationStep, ...]:
         """
         Get the sequence of migration steps needed to go from one version to another
         
         Returns:
-            List of (from_version, to_version) tuples representing migration steps
+            Tuple of (from_version, to_version, migration_key) tuples representing
+            migration steps, empty if there is no path; shared between calls, so
+            never mutated
         """
-        path = []
-        current_version = from_version
-        
-        while current_version != to_version:
-            next_version = self._version_progression.get(current_version)
-            if not next_version:
-                self.logger.error(f"No migration path from {current_version}")
-                return []
-            
-            path.append((current_version, next_version))
-            current_version = next_version
-            
-            # Safety check to prevent infinite loops
-            if len(path) > 10:
-                self.logger.error("Migration path too long, possible circular dependency")
-                return []
-        
-        return path
+        return _MIGRATION_PATHS.get((from_version, to_version), ())
     
-    def _execute_migration_step(self, from_version: str, to_version: str) -> bool:
+    def _execute_migration_step(self, from_version: str, to_version: str, migration_key: Optional[str] = None) -> bool:
         """Execute a single migration step"""
-        migration_key = f"{from_version}->{to_version}"
+        if migration_key is None:
+            migration_key = f"{from_version}->{to_version}"
         
         if migration_key not in self._migration_registry:
             self.logger.error(f"No migration available for {migration_key}")
             return False
         
-        self.logger.info(f"Executing migration step: {migration_key}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing migration step: {migration_key}")
         
-        # Get migration class and instantiate
-        migration_class = self._migration_registry[migration_key]
-        migration = migration_class(
-            project_path=self.project_path,
-            file_manager=self.file_manager,
-            dry_run=self.dry_run
-        )
+        migration = self._get_migration(migration_key, self.dry_run)
         
         # Execute the migration
         try:
             success = migration.execute()
             if success:
-                self.logger.info(f"Migration step {migration_key} completed successfully")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"Migration step {migration_key} completed successfully")
                 # Update project version after each successful step
                 if not self.dry_run:
                     self._update_project_version(to_version)
+                    # Rewritten files make the walk's cached stat information stale
+                    self.file_manager.invalidate_cache()
             else:
                 self.logger.error(f"Migration step {migration_key} failed")
             return success
@@ -210,8 +308,79 @@ class MigrationEngine:
             self.logger.error(f"Migration step {migration_key} failed with error: {e}", exc_info=True)
             return False
     
-    def _create_backup(self) -> bool:
-        """Create a backup of the project before migration"""
+    def _get_migration(self, migration_key: str, dry_run: bool) -> BaseMigration:
+        """
+        Get the migration instance for a step, building it on first use
+        
+        Args:
+            migration_key: Registry key such as "0.17->0.18"
+            dry_run: Dry run mode of the instance
+            
+        Returns:
+            The migration, shared by later calls with the same key and mode
+        """
+        cache_key = (migration_key, dry_run)
+        migration = self._migration_cache.get(cache_key)
+        if migration is None:
+            migration_class = _load_migration_class(self._migration_registry[migration_key])
+            migration = migration_class(
+                project_path=self.project_path,
+                file_manager=self.file_manager,
+                dry_run=dry_run,
+                use_cache=self.use_cache
+            )
+            self._migration_cache[cache_key] = migration
+        return migration
+    
+    def _step_has_files(self, migration_key: str) -> bool:
+        """
+        Check whether any project file matches a step's affected patterns
+        
+        Args:
+            migration_key: Registry key of the step, such as "0.17->0.18"
+            
+        Returns:
+            True if the step has files to process or is unknown, False otherwise
+        """
+        if migration_key not in self._migration_registry:
+            # Let _execute_migration_step report the missing migration
+            return True
+        migration_class = _load_migration_class(self._migration_registry[migration_key])
+        return any(
+            self.file_manager.find_files_by_pattern(pattern, sort=False)
+            for pattern in migration_class.AFFECTED_PATTERNS
+        )
+    
+    def _get_affected_patterns(self, migration_steps: Iterable[MigrationStep]) -> Set[str]:
+        """
+        Collect the file patterns every step of a migration path may rewrite
+        
+        Args:
+            migration_steps: (from_version, to_version, migration_key) steps of the migration path
+            
+        Returns:
+            Union of the steps' affected glob patterns
+        """
+        patterns: Set[str] = set()
+        for _, _, migration_key in migration_steps:
+            if migration_key in self._migration_registry:
+                migration_class = _load_migration_class(self._migration_registry[migration_key])
+                patterns.update(migration_class.AFFECTED_PATTERNS)
+        return patterns
+    
+    def _create_backup(self, patterns: Optional[Iterable[str]] = None) -> bool:
+        """
+        Create a backup of the project before migration
+        
+        Args:
+            patterns: Glob patterns of the files the migration may rewrite; when
+                given only those files plus Cargo.toml and Cargo.lock are copied,
+                otherwise the source, example, asset, bench and test directories
+                are copied whole
+            
+        Returns:
+            True if the backup was created, False otherwise
+        """
         try:
             if self.backup_dir.exists():
                 # Create timestamped backup directory
@@ -225,6 +394,11 @@ class MigrationEngine:
             # Create backup directory
             backup_path.mkdir(parents=True, exist_ok=True)
             
+            if patterns is not None:
+                self._backup_matching_files(backup_path, patterns)
+                self.logger.info("Backup created successfully")
+                return True
+            
             # Copy important files
             files_to_backup = [
                 # "Cargo.toml",  # Handled separately
@@ -236,24 +410,52 @@ class MigrationEngine:
                 "tests/"
             ]
             
+            # One scandir of the project root answers exists/is_file/is_dir for every item
+            with os.scandir(self.project_path) as entries:
+                top_level = {entry.name: entry for entry in entries}
+            
+            pairs: List[Tuple[Path, Path]] = []
+            # Copied directories, whose metadata is applied once their files are in place
+            dir_pairs: List[Tuple[Path, Path]] = []
+            backed_up: List[Tuple[Path, Path]] = []
+            
             # Backup Cargo.toml (case-insensitive)
             cargo_toml = self.file_manager.find_cargo_toml()
             if cargo_toml:
-                dest_path = backup_path / cargo_toml.name
-                shutil.copy2(cargo_toml, dest_path)
-
+                pairs.append((cargo_toml, backup_path / cargo_toml.name))
             
             for file_pattern in files_to_backup:
-                source_path = self.project_path / file_pattern
-                if source_path.exists():
-                    dest_path = backup_path / file_pattern
-                    
-                    if source_path.is_file():
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(source_path, dest_path)
-                    elif source_path.is_dir():
-                        shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
-                    
+                entry = top_level.get(file_pattern.rstrip('/'))
+                if entry is None:
+                    continue
+                
+                source_path = Path(entry.path)
+                dest_path = backup_path / file_pattern
+                if entry.is_file():
+                    pairs.append((source_path, dest_path))
+                elif entry.is_dir():
+                    dest_path.mkdir(exist_ok=True)
+                    dir_pairs.append((source_path, dest_path))
+                    for relative, child in self._iter_backup_entries(source_path):
+                        if child.is_dir():
+                            (dest_path / relative).mkdir(exist_ok=True)
+                            dir_pairs.append((Path(child.path), dest_path / relative))
+                        else:
+                            pairs.append((Path(child.path), dest_path / relative))
+                else:
+                    continue
+                backed_up.append((source_path, dest_path))
+            
+            # Every file of every backed-up directory goes through one executor
+            self._copy_files_parallel(pairs)
+            
+            # Like copytree, directories keep their mode and times; applied last since
+            # adding files updates a directory's mtime
+            for source_dir, dest_dir in dir_pairs:
+                shutil.copystat(source_dir, dest_dir)
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for source_path, dest_path in backed_up:
                     self.logger.debug(f"Backed up: {source_path} -> {dest_path}")
             
             self.logger.info("Backup created successfully")
@@ -263,6 +465,79 @@ class MigrationEngine:
             self.logger.error(f"Failed to create backup: {e}", exc_info=True)
             return False
     
+    def _backup_matching_files(self, backup_path: Path, patterns: Iterable[str]) -> None:
+        """
+        Copy the project files matching any of the patterns, plus the manifests
+        
+        Args:
+            backup_path: Directory to copy into, mirroring the project layout
+            patterns: Glob patterns relative to the project root
+        """
+        files: Set[Path] = set()
+        for pattern in patterns:
+            files.update(self.file_manager.find_files_by_pattern(pattern, sort=False))
+        
+        cargo_toml = self.file_manager.find_cargo_toml()
+        if cargo_toml:
+            files.add(cargo_toml)
+        cargo_lock = self.project_path / "Cargo.lock"
+        if cargo_lock.is_file():
+            files.add(cargo_lock)
+        
+        pairs: List[Tuple[Path, Path]] = []
+        target_dirs: Set[Path] = set()
+        for file_path in files:
+            dest_path = backup_path / file_path.relative_to(self.project_path)
+            target_dirs.add(dest_path.parent)
+            pairs.append((file_path, dest_path))
+        for target_dir in target_dirs:
+            target_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._copy_files_parallel(pairs)
+    
+    def _iter_backup_entries(self, root: Path) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Walk a directory tree with os.scandir, parents before their contents
+        
+        Directories are entered through symlinks the same way shutil.copytree
+        does by default. The DirEntry objects carry the type information from
+        the directory listing, so no separate stat is needed per entry.
+        
+        Args:
+            root: Directory to walk
+            
+        Yields:
+            (path relative to root, DirEntry) for every file and directory
+        """
+        stack = [('', str(root))]
+        while stack:
+            relative_dir, directory = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = relative_dir + entry.name
+                    if entry.is_dir():
+                        stack.append((relative + os.sep, entry.path))
+                    yield relative, entry
+    
+    def _copy_files_parallel(self, pairs: List[Tuple[Path, Path]]) -> None:
+        """
+        Copy files with their metadata, concurrently for larger batches
+        
+        Each copy goes through FileManager.copy_file, so the kernel moves the
+        data where it can.
+        
+        Args:
+            pairs: (source, destination) paths; destination directories must exist
+        """
+        workers = min(self.file_manager.max_workers, len(pairs))
+        if len(pairs) < FileManager.PARALLEL_THRESHOLD or workers <= 1:
+            for pair in pairs:
+                self.file_manager.copy_file(*pair)
+            return
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda pair: self.file_manager.copy_file(*pair), pairs))
+    
     def _update_project_version(self, new_version: str) -> None:
         """Update the project's Bevy version in Cargo.toml"""
         try:
@@ -275,32 +550,22 @@ class MigrationEngine:
             clean_version = new_version.split('-')[0]
             
             # Read current content
-            content = cargo_toml_path.read_text(encoding='utf-8')
+            content = read_cargo_toml(cargo_toml_path)
             original_content = content
             
-            # Update bevy dependency version
-            import re
+            # Update bevy dependency version, both declaration forms in one pass
+            content, count = _BEVY_VERSION_RE.subn(rf'\g<1>{clean_version}\g<2>', content)
             
-            # More robust patterns for Cargo.toml
-            patterns = [
-                # bevy = "0.15" or bevy = '0.15'
-                (r'(\bbevy\s*=\s*["\'])[^"\']*(["\'])', rf'\g<1>{clean_version}\g<2>'),
-                # bevy = { version = "0.15" }
-                (r'(\bbevy\s*=\s*\{[^}]*version\s*=\s*["\'])[^"\']*(["\'])', rf'\g<1>{clean_version}\g<2>'),
-            ]
-            
-            for pattern, replacement in patterns:
-                content = re.sub(pattern, replacement, content)
-            
-            if content != original_content:
-                cargo_toml_path.write_text(content, encoding='utf-8')
+            if count and content != original_content:
+                write_text_atomic(cargo_toml_path, content)
+                invalidate_cargo_cache()
                 self.logger.info(f"Updated Cargo.toml to Bevy {clean_version}")
             else:
-                self.logger.debug(f"Cargo.toml already at version {clean_version} or Bevy dependency not found")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Cargo.toml already at version {clean_version} or Bevy dependency not found")
                 
         except Exception as e:
             self.logger.error(f"Failed to update project version: {e}", exc_info=True)
-            self.logger.error(f"Failed to update project version: {e}", exc_info=True)
     
     def get_available_migrations(self) -> List[str]:
         """Get list of available migration paths"""
@@ -317,14 +582,14 @@ class MigrationEngine:
             
             # Check for Rust files instead of strict src directory
             # Projects might use custom source directories defined in Cargo.toml
-            rust_files = self.file_manager.find_rust_files()
+            rust_files = self.file_manager.find_rust_files(sort=False)
             if not rust_files:
                 self.logger.error("No Rust files found in project")
                 return False
             
             # Try to detect if Bevy is used
-            cargo_content = cargo_toml.read_text(encoding='utf-8')
-            if 'bevy' not in cargo_content.lower():
+            cargo_content = read_cargo_toml(cargo_toml)
+            if not _BEVY_MENTION_RE.search(cargo_content):
                 self.logger.warning("Bevy dependency not found in Cargo.toml")
                 # Don't return False here as it might be in a workspace
             
@@ -347,25 +612,19 @@ class MigrationEngine:
         try:
             migration_steps = self._get_migration_path(from_version, to_version)
             
-            for step_from, step_to in migration_steps:
-                migration_key = f"{step_from}->{step_to}"
+            for _, _, migration_key in migration_steps:
                 if migration_key in self._migration_registry:
-                    migration_class = self._migration_registry[migration_key]
-                    migration = migration_class(
-                        project_path=self.project_path,
-                        file_manager=self.file_manager,
-                        dry_run=True  # Always dry run for summary
-                    )
-                    
+                    # Description and patterns are class metadata, no instance needed
+                    migration_class = _load_migration_class(self._migration_registry[migration_key])
                     step_summary = {
                         "step": migration_key,
-                        "description": migration.get_description(),
-                        "affected_patterns": migration.get_affected_patterns()
+                        "description": migration_class.DESCRIPTION,
+                        "affected_patterns": list(migration_class.AFFECTED_PATTERNS)
                     }
                     summary["migration_steps"].append(step_summary)
             
             # Estimate number of files that will be processed
-            rust_files = self.file_manager.find_rust_files()
+            rust_files = self.file_manager.find_rust_files(sort=False)
             summary["estimated_files"] = len(rust_files)
             
         except Exception as e:
@@ -0,0 +1,157 @@
+"""
+Transform Cache - Persistent store of transformation results between runs
+Lets re-runs (after a failure, or over sources restored from a backup) skip files whose content is unchanged
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+
+# Directory under the project root holding the cache database
+CACHE_DIR_NAME = ".bevy_migrate_cache"
+
+
+class TransformCache:
+    """
+    SQLite-backed cache of transformation results
+
+    Entries are keyed by the digest of a file's content, the indices of the transformations
+    applicable to it and a fingerprint of the transformation set, so editing a migration
+    (or the processor applying it) never serves stale results. Each migration stores its
+    entries under its own namespace, and entries left by an older fingerprint of that
+    migration are pruned when the cache opens. Entries are committed in one transaction
+    on close.
+    """
+
+    DATABASE_NAME = "transforms.sqlite3"
+    # Bumped whenever the table layout changes; older databases are rebuilt
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_dir: Path, fingerprint: bytes, namespace: str = ""):
+        """
+        Open (creating if needed) the cache database
+
+        Args:
+            cache_dir: Directory holding the database
+            fingerprint: Digest identifying the transformation set and the code applying it
+            namespace: Name of the migration owning the entries (e.g. its qualified class name)
+
+        Raises:
+            OSError, sqlite3.Error: If the database can't be created or opened
+        """
+        self.fingerprint = fingerprint
+        self.namespace = namespace
+        self.logger = logging.getLogger(__name__)
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Files are transformed on worker threads; the lock serializes access to the connection
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(cache_dir / self.DATABASE_NAME),
+            check_same_thread=False
+        )
+        try:
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS transforms")
+                self._connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS transforms "
+                "(key BLOB PRIMARY KEY, namespace TEXT NOT NULL, fingerprint BLOB NOT NULL, "
+                "transformed TEXT, applied TEXT NOT NULL)"
+            )
+            # Results of an older version of this migration can never be hit again
+            self._connection.execute(
+                "DELETE FROM transforms WHERE namespace = ? AND fingerprint != ?",
+                (namespace, fingerprint)
+            )
+        except BaseException:
+            self._connection.close()
+            raise
+
+    def _key(self, digest: bytes, indices: Sequence[int]) -> bytes:
+        """Build the row key for a content digest and applicable transformation indices"""
+        return self.fingerprint + digest + ",".join(map(str, indices)).encode()
+
+    def get(self, digest: bytes, indices: Sequence[int]) -> Optional[Tuple[Optional[str], List[str]]]:
+        """
+        Look up a cached result
+
+        Args:
+            digest: Digest of the file content
+            indices: Indices of the transformations applicable to the file
+
+        Returns:
+            (transformed content or None if unchanged, applied transformation descriptions),
+            or None on a cache miss
+        """
+        with self._lock:
+            if self._connection is None:
+                return None
+            try:
+                row = self._connection.execute(
+                    "SELECT transformed, applied FROM transforms WHERE key = ?",
+                    (self._key(digest, indices),)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(
+        self,
+        digest: bytes,
+        indices: Sequence[int],
+        transformed_content: Optional[str],
+        applied_transformations: List[str]
+    ) -> None:
+        """
+        Store a result
+
+        Args:
+            digest: Digest of the file content
+            indices: Indices of the transformations applicable to the file
+            transformed_content: Transformed content, or None if the file is unchanged
+            applied_transformations: Descriptions of the applied transformations
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO transforms (key, namespace, fingerprint, transformed, applied) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        self._key(digest, indices),
+                        self.namespace,
+                        self.fingerprint,
+                        transformed_content,
+                        json.dumps(applied_transformations)
+                    )
+                )
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        """Commit stored results and close the database"""
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to save transform cache: {e}")
+            finally:
+                self._connection.close()
+                self._connection = None
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using the cache after a database error; transformations run uncached"""
+        self.logger.warning(f"Transform cache disabled: {error}")
+        self._connection.close()
+        self._connection = None
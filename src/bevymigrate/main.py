@@ -5,23 +5,44 @@ Main entry point for migrating Bevy projects from version 0.12 to 0.18
 """
 
 import argparse
+import atexit
+import queue
 import sys
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 
-from bevymigrate.core.migration_engine import MigrationEngine
+from bevymigrate.core.migration_engine import BevyVersion, MigrationEngine
 from bevymigrate.utils.version_detector import VersionDetector
 
 
 def setup_logging(verbose: bool = False) -> None:
-    """Setup logging configuration"""
+    """
+    Setup logging configuration
+    
+    Records are put on a queue and written to stdout by a single listener
+    thread, so backup and migration worker threads never wait on the
+    stream lock.
+    """
     level = logging.DEBUG if verbose else logging.INFO
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler only merges the message arguments; the stream handler applies the format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            queue_handler
         ]
     )
 
@@ -50,7 +71,7 @@ Examples:
         '--target-version',
         type=str,
         default='0.18',
-        choices=['0.13', '0.14', '0.16', '0.17', '0.18', '0.19-part1'],
+        choices=[version.label for version in BevyVersion if version > BevyVersion.V0_12],
         help='Target Bevy version to migrate to (default: 0.18)'
     )
     
@@ -78,6 +99,12 @@ Examples:
         help='Force migration even if project version is unclear'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Transform every file instead of reusing results cached in .bevy_migrate_cache'
+    )
+    
     parser.add_argument(
         '--exclude',
         type=str,
@@ -147,15 +174,14 @@ def main() -> int:
             return 0
         
         # Validate version progression
-        version_order = ["0.12", "0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "0.19-part1"]
         try:
-            current_idx = version_order.index(current_version)
-            target_idx = version_order.index(args.target_version)
+            current = BevyVersion.parse(current_version)
+            target = BevyVersion.parse(args.target_version)
         except ValueError:
             logger.error(f"Unsupported version detected: {current_version}")
             return 1
         
-        if current_idx >= target_idx:
+        if current >= target:
             logger.error(f"Cannot migrate backwards from {current_version} to {args.target_version}")
             return 1
         
@@ -171,7 +197,8 @@ def main() -> int:
             project_path=project_path,
             backup_dir=backup_dir,
             dry_run=args.dry_run,
-            exclude_patterns=args.exclude
+            exclude_patterns=args.exclude,
+            use_cache=not args.no_cache
         )
         
         # Perform migration
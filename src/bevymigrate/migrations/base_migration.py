@@ -3,19 +3,28 @@ Base Migration - Abstract base class for all Bevy version migrations
 Provides common functionality and interface for migration modules
 """
 
+import hashlib
 import logging
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, ClassVar, Tuple
 from dataclasses import dataclass
 
 from bevymigrate.core.file_manager import FileManager
+from bevymigrate.core import ast_processor as ast_processor_module
 from bevymigrate.core.ast_processor import ASTProcessor, ASTTransformation
+from bevymigrate.core.transform_cache import CACHE_DIR_NAME, TransformCache
 
 
 @dataclass
 class MigrationResult:
     """Result of a migration operation"""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        "success", "files_processed", "files_modified", "transformations_applied", "errors", "warnings"
+    )
+    
     success: bool
     files_processed: int
     files_modified: int
@@ -36,15 +45,24 @@ class BaseMigration(ABC):
     """
     Abstract base class for all Bevy version migrations
     
-    Each migration module should inherit from this class and implement
-    the required abstract methods.
+    Each migration module should inherit from this class, implement
+    the required abstract methods and set DESCRIPTION and AFFECTED_PATTERNS.
     """
     
+    # Static metadata, readable from the class without building an instance
+    DESCRIPTION: ClassVar[str] = ""
+    AFFECTED_PATTERNS: ClassVar[Tuple[str, ...]] = ()
+    
+    # Number of modified files listed by name in the summary logged after transforming
+    MODIFIED_FILES_LOGGED: ClassVar[int] = 20
+    
     def __init__(
         self,
         project_path: Path,
         file_manager: FileManager,
-        dry_run: bool = False
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True
     ):
         """
         Initialize the base migration
@@ -53,20 +71,30 @@ class BaseMigration(ABC):
             project_path: Path to the Bevy project
             file_manager: File manager instance for file operations
             dry_run: If True, only show what would be changed
+            max_workers: Number of threads transforming files concurrently (defaults to CPU count)
+            use_cache: If True, reuse transformation results of unchanged files from earlier runs
+                (dry runs never read or write the cache)
         """
         self.project_path = project_path
         self.file_manager = file_manager
         self.dry_run = dry_run
+        self.use_cache = use_cache
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Initialize AST processor
-        self.ast_processor = ASTProcessor(project_path, dry_run)
+        # Initialize AST processor; it shards the files over max_workers threads
+        self.ast_processor = ASTProcessor(project_path, dry_run, max_workers=max_workers)
         
         # Migration metadata
         self._from_version: Optional[str] = None
         self._to_version: Optional[str] = None
         self._description: Optional[str] = None
         
+        # Files matching the affected patterns, collected on first use
+        self._files_cache: Optional[List[Path]] = None
+        
+        # Result of get_transformations(), built on first use
+        self._cached_transformations: Optional[List[ASTTransformation]] = None
+        
         self.logger.info(f"Initialized migration: {self.__class__.__name__}")
         self.logger.info(f"Project path: {project_path}")
         self.logger.info(f"Dry run mode: {dry_run}")
@@ -84,10 +112,9 @@ class BaseMigration(ABC):
         pass
     
     @property
-    @abstractmethod
     def description(self) -> str:
         """Human-readable description of this migration"""
-        pass
+        return type(self).DESCRIPTION
     
     @abstractmethod
     def get_transformations(self) -> List[ASTTransformation]:
@@ -99,7 +126,6 @@ class BaseMigration(ABC):
         """
         pass
     
-    @abstractmethod
     def get_affected_patterns(self) -> List[str]:
         """
         Get list of file patterns that this migration affects
@@ -107,7 +133,27 @@ class BaseMigration(ABC):
         Returns:
             List of glob patterns (e.g., ["**/*.rs", "Cargo.toml"])
         """
-        pass
+        return list(type(self).AFFECTED_PATTERNS)
+    
+    def _transformations(self) -> List[ASTTransformation]:
+        """
+        Get this migration's transformations, building them only once
+        
+        Returns:
+            The list returned by the first get_transformations() call
+        """
+        if self._cached_transformations is None:
+            self._cached_transformations = self.get_transformations()
+        return self._cached_transformations
+    
+    def invalidate_caches(self) -> None:
+        """
+        Forget the cached transformations and file list
+        
+        Call this from subclasses whose transformations depend on state that has changed.
+        """
+        self._cached_transformations = None
+        self._files_cache = None
     
     def execute(self) -> bool:
         """
@@ -119,6 +165,9 @@ class BaseMigration(ABC):
         try:
             self.logger.info(f"Starting migration from {self.from_version} to {self.to_version}")
             
+            # Files may have changed since an earlier run or preview
+            self._files_cache = None
+            
             # Pre-migration validation
             if not self.validate_preconditions():
                 self.logger.error("Pre-migration validation failed")
@@ -180,11 +229,10 @@ class BaseMigration(ABC):
                 return False
             
             # Validate transformations
-            transformations = self.get_transformations()
-            for transformation in transformations:
-                if not self.ast_processor.validate_transformation(transformation):
-                    self.logger.error(f"Invalid transformation: {transformation.description}")
-                    return False
+            invalid = self.ast_processor.validate_transformations(self._transformations())
+            if invalid is not None:
+                self.logger.error(f"Invalid transformation: {invalid.description}")
+                return False
             
             self.logger.debug("Pre-migration validation passed")
             return True
@@ -221,29 +269,30 @@ class BaseMigration(ABC):
         return True
     
     def _get_files_to_process(self) -> List[Path]:
-        """Get list of files that should be processed by this migration"""
-        all_files = []
+        """
+        Get list of files that should be processed by this migration
         
-        try:
-            patterns = self.get_affected_patterns()
-            
-            for pattern in patterns:
-                matching_files = self.file_manager.find_files_by_pattern(pattern)
-                all_files.extend(matching_files)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_files = []
-            for file_path in all_files:
-                if file_path not in seen:
-                    seen.add(file_path)
-                    unique_files.append(file_path)
-            
-            return unique_files
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get files to process: {e}", exc_info=True)
-            return []
+        The list is computed once and reused until `execute()` starts a new run.
+        """
+        if self._files_cache is None:
+            try:
+                patterns = self.get_affected_patterns()
+                if len(patterns) == 1:
+                    # A single pattern's matches are already unique
+                    self._files_cache = self.file_manager.find_files_by_pattern(patterns[0])
+                else:
+                    # Remove duplicates while preserving order
+                    self._files_cache = list(dict.fromkeys(
+                        file_path
+                        for pattern in patterns
+                        for file_path in self.file_manager.find_files_by_pattern(pattern)
+                    ))
+                
+            except Exception as e:
+                self.logger.error(f"Failed to get files to process: {e}", exc_info=True)
+                return []
+        
+        return list(self._files_cache)
     
     def _apply_transformations(self, files_to_process: List[Path]) -> MigrationResult:
         """Apply AST transformations to the files"""
@@ -257,21 +306,28 @@ class BaseMigration(ABC):
         )
         
         try:
-            transformations = self.get_transformations()
+            transformations = self._transformations()
             if not transformations:
                 self.logger.warning("No transformations defined for this migration")
                 return result
             
-            # Apply transformations using AST processor
-            transformation_results = self.ast_processor.apply_transformations(
-                files_to_process,
-                transformations
-            )
+            # Apply transformations using AST processor (file contents aren't needed here)
+            persistent_cache = self._open_transform_cache()
+            try:
+                transformation_results = self.ast_processor.apply_transformations(
+                    files_to_process,
+                    transformations,
+                    keep_content=False,
+                    persistent_cache=persistent_cache
+                )
+            finally:
+                if persistent_cache is not None:
+                    persistent_cache.close()
             
-            # Process results
+            # Process results; per-file messages are built only when debug logging is on
+            log_debug = self.logger.isEnabledFor(logging.DEBUG)
+            modified_files = []
             for transform_result in transformation_results:
-                result.files_processed += 1
-                
                 if not transform_result.success:
                     result.success = False
                     error_msg = f"Failed to process {transform_result.file_path}"
@@ -280,17 +336,28 @@ class BaseMigration(ABC):
                     result.add_error(error_msg)
                     continue
                 
-                # Check if file was modified
-                if transform_result.original_content != transform_result.transformed_content:
-                    result.files_modified += 1
-                    self.logger.info(f"Modified file: {transform_result.file_path}")
-                
-                # Count applied transformations
-                result.transformations_applied += len(transform_result.applied_transformations)
+                # The processor flags modified files, so contents are never compared here
+                if transform_result.modified:
+                    modified_files.append(transform_result.file_path)
                 
                 # Log applied transformations
-                for transformation_desc in transform_result.applied_transformations:
-                    self.logger.debug(f"Applied '{transformation_desc}' to {transform_result.file_path}")
+                if log_debug:
+                    for transformation_desc in transform_result.applied_transformations:
+                        self.logger.debug(f"Applied '{transformation_desc}' to {transform_result.file_path}")
+            
+            # Counters are reduced in one go (failed results never list applied transformations)
+            result.files_processed = len(transformation_results)
+            result.files_modified = len(modified_files)
+            result.transformations_applied = sum(
+                len(transform_result.applied_transformations) for transform_result in transformation_results
+            )
+            
+            if modified_files and self.logger.isEnabledFor(logging.INFO):
+                shown = ", ".join(str(file_path) for file_path in modified_files[:self.MODIFIED_FILES_LOGGED])
+                more = len(modified_files) - self.MODIFIED_FILES_LOGGED
+                self.logger.info(
+                    f"Modified {len(modified_files)} files: {shown}" + (f" (and {more} more)" if more > 0 else "")
+                )
             
             return result
             
@@ -300,6 +367,42 @@ class BaseMigration(ABC):
             result.add_error(f"Transformation application failed: {e}")
             return result
     
+    def _open_transform_cache(self) -> Optional[TransformCache]:
+        """
+        Open the on-disk transform cache, or return None if caching is off or unavailable
+        
+        Dry runs never use it, since opening it would write to the project.
+        """
+        if not self.use_cache or self.dry_run:
+            return None
+        try:
+            return TransformCache(
+                self.project_path / CACHE_DIR_NAME,
+                self._transformations_fingerprint(),
+                namespace=f"{type(self).__module__}.{type(self).__qualname__}"
+            )
+        except Exception as e:
+            self.logger.warning(f"Transform cache unavailable, transforming without it: {e}")
+            return None
+    
+    def _transformations_fingerprint(self) -> bytes:
+        """
+        Digest of the code defining and applying this migration's transformations
+        
+        Transformations (including their callbacks) are built by the modules of the
+        migration's class hierarchy, base_migration included, so hashing their source
+        along with the processor's and the backend in use covers every change to their results.
+        """
+        modules = [
+            sys.modules[cls.__module__] for cls in type(self).__mro__
+            if isinstance(cls, type) and issubclass(cls, BaseMigration)
+        ]
+        digest = hashlib.blake2b(digest_size=16)
+        for module in dict.fromkeys(modules + [ast_processor_module]):
+            digest.update(Path(module.__file__).read_bytes())
+        digest.update(self.ast_processor.backend_version().encode())
+        return digest.digest()
+    
     def _log_migration_results(self, result: MigrationResult) -> None:
         """Log the results of the migration"""
         if result.success:
@@ -389,8 +492,10 @@ class BaseMigration(ABC):
         backup_dir = self.project_path / "migration_backup" / f"{self.from_version}_to_{self.to_version}"
         success_count = 0
         
-        for file_path in file_paths:
-            if self.file_manager.backup_file(file_path, backup_dir):
+        # Copies are I/O-bound, so the file manager runs larger batches concurrently
+        backup_paths = self.file_manager.backup_files(file_paths, backup_dir)
+        for file_path, backup_path in zip(file_paths, backup_paths):
+            if backup_path:
                 success_count += 1
             else:
                 self.logger.warning(f"Failed to backup file: {file_path}")
@@ -411,7 +516,7 @@ class BaseMigration(ABC):
             "to_version": self.to_version,
             "description": self.description,
             "affected_patterns": self.get_affected_patterns(),
-            "transformation_count": len(self.get_transformations()),
+            "transformation_count": len(self._transformations()),
             "dry_run": self.dry_run
         }
     
@@ -426,31 +531,40 @@ class BaseMigration(ABC):
             Dictionary with preview information
         """
         try:
-            files_to_process = self._get_files_to_process()[:max_files]
-            transformations = self.get_transformations()
+            all_files = self._get_files_to_process()
+            files_to_process = all_files[:max_files]
+            transformations = self._transformations()
             
             previews = []
             for file_path in files_to_process:
+                # Filter by file pattern first; files no transformation targets are never read
+                relative_path = self.ast_processor.relative_path(file_path)
+                applicable = [
+                    transformation for transformation in transformations
+                    if self.ast_processor._should_apply_transformation(file_path, transformation, relative_path)
+                ]
+                if not applicable:
+                    continue
+                
                 content = self.file_manager.read_file_content(file_path)
                 if content is None:
                     continue
                 
                 file_previews = []
-                for transformation in transformations:
-                    if self.ast_processor._should_apply_transformation(file_path, transformation):
-                        preview = self.ast_processor.get_transformation_preview(content, transformation)
-                        if preview.get("has_changes", False):
-                            file_previews.append(preview)
+                for transformation in applicable:
+                    preview = self.ast_processor.get_transformation_preview(content, transformation)
+                    if preview.get("has_changes", False):
+                        file_previews.append(preview)
                 
                 if file_previews:
                     previews.append({
-                        "file_path": str(file_path.relative_to(self.project_path)),
+                        "file_path": relative_path,
                         "transformations": file_previews
                     })
             
             return {
                 "migration_info": self.get_migration_info(),
-                "total_files_to_process": len(self._get_files_to_process()),
+                "total_files_to_process": len(all_files),
                 "previewed_files": len(previews),
                 "file_previews": previews
             }
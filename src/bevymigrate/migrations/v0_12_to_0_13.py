@@ -25,6 +25,16 @@ class Migration_0_12_to_0_13(BaseMigration):
     - Many rendering, UI, and windowing changes
     """
     
+    DESCRIPTION = "Migrate Bevy project from version 0.12 to 0.13 - Major ECS, rendering, and API changes"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",           # All Rust source files
+        "src/**/*.rs",       # Source files specifically
+        "examples/**/*.rs",  # Example files
+        "benches/**/*.rs",   # Benchmark files
+        "tests/**/*.rs",     # Test files
+        "Cargo.toml"         # Cargo manifest for dependency updates
+    )
+    
     @property
     def from_version(self) -> str:
         """Source Bevy version for this migration"""
@@ -35,11 +45,6 @@ class Migration_0_12_to_0_13(BaseMigration):
         """Target Bevy version for this migration"""
         return "0.13"
     
-    @property
-    def description(self) -> str:
-        """Human-readable description of this migration"""
-        return "Migrate Bevy project from version 0.12 to 0.13 - Major ECS, rendering, and API changes"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         """
         Get the list of AST transformations for migrating from 0.12 to 0.13
@@ -521,22 +526,6 @@ class Migration_0_12_to_0_13(BaseMigration):
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        """
-        Get list of file patterns that this migration affects
-        
-        Returns:
-            List of glob patterns
-        """
-        return [
-            "**/*.rs",           # All Rust source files
-            "src/**/*.rs",       # Source files specifically
-            "examples/**/*.rs",  # Example files
-            "benches/**/*.rs",   # Benchmark files
-            "tests/**/*.rs",     # Test files
-            "Cargo.toml"         # Cargo manifest for dependency updates
-        ]
-    
     def pre_migration_steps(self) -> bool:
         """
         Execute steps before applying transformations
@@ -27,6 +27,17 @@ class Migration_0_13_to_0_14(BaseMigration):
     - Many breaking API changes across all systems
     """
     
+    DESCRIPTION = "Migrate Bevy project from version 0.13 to 0.14 - Major color, rendering, ECS, and API overhaul"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",           # All Rust source files
+        "src/**/*.rs",       # Source files specifically
+        "examples/**/*.rs",  # Example files
+        "benches/**/*.rs",   # Benchmark files
+        "tests/**/*.rs",     # Test files
+        "**/*.wgsl",         # Shader files (for WGSL changes)
+        "Cargo.toml"         # Cargo manifest for dependency updates
+    )
+    
     @property
     def from_version(self) -> str:
         """Source Bevy version for this migration"""
@@ -37,11 +48,6 @@ class Migration_0_13_to_0_14(BaseMigration):
         """Target Bevy version for this migration"""
         return "0.14"
     
-    @property
-    def description(self) -> str:
-        """Human-readable description of this migration"""
-        return "Migrate Bevy project from version 0.13 to 0.14 - Major color, rendering, ECS, and API overhaul"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         """
         Get the list of AST transformations for migrating from 0.13 to 0.14
@@ -656,23 +662,6 @@ class Migration_0_13_to_0_14(BaseMigration):
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        """
-        Get list of file patterns that this migration affects
-        
-        Returns:
-            List of glob patterns
-        """
-        return [
-            "**/*.rs",           # All Rust source files
-            "src/**/*.rs",       # Source files specifically
-            "examples/**/*.rs",  # Example files
-            "benches/**/*.rs",   # Benchmark files
-            "tests/**/*.rs",     # Test files
-            "**/*.wgsl",         # Shader files (for WGSL changes)
-            "Cargo.toml"         # Cargo manifest for dependency updates
-        ]
-    
     def pre_migration_steps(self) -> bool:
         """
         Execute steps before applying transformations
@@ -29,6 +29,16 @@ class Migration_0_14_to_0_15_Part1(BaseMigration):
     - Many method renames and signature changes
     """
     
+    DESCRIPTION = "Migrate Bevy project from version 0.14 to 0.15 (Part 1: Core API Changes)"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+        "Cargo.toml"
+    )
+    
     @property
     def from_version(self) -> str:
         """Source Bevy version for this migration"""
@@ -39,11 +49,6 @@ class Migration_0_14_to_0_15_Part1(BaseMigration):
         """Target Bevy version for this migration"""
         return "0.15-part1"
     
-    @property
-    def description(self) -> str:
-        """Human-readable description of this migration"""
-        return "Migrate Bevy project from version 0.14 to 0.15 (Part 1: Core API Changes)"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         """
         Get the list of AST transformations for Part 1
@@ -631,22 +636,6 @@ class Migration_0_14_to_0_15_Part1(BaseMigration):
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        """
-        Get list of file patterns that this migration affects
-        
-        Returns:
-            List of glob patterns
-        """
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-            "Cargo.toml"
-        ]
-    
     def pre_migration_steps(self) -> bool:
         """Execute steps before applying transformations"""
         try:
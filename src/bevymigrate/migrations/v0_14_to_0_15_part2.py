@@ -31,6 +31,16 @@ class Migration_0_14_to_0_15_Part2(BaseMigration):
     - Transform/Visibility bundles → individual components
     """
     
+    DESCRIPTION = "Migrate Bevy project from version 0.14 to 0.15 (Part 2: Required Components)"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+        "Cargo.toml"
+    )
+    
     @property
     def from_version(self) -> str:
         """Source Bevy version for this migration"""
@@ -41,11 +51,6 @@ class Migration_0_14_to_0_15_Part2(BaseMigration):
         """Target Bevy version for this migration"""
         return "0.15"
     
-    @property
-    def description(self) -> str:
-        """Human-readable description of this migration"""
-        return "Migrate Bevy project from version 0.14 to 0.15 (Part 2: Required Components)"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         """
         Get the list of AST transformations for Part 2
@@ -437,22 +442,6 @@ class Migration_0_14_to_0_15_Part2(BaseMigration):
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        """
-        Get list of file patterns that this migration affects
-        
-        Returns:
-            List of glob patterns
-        """
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-            "Cargo.toml"
-        ]
-    
     def pre_migration_steps(self) -> bool:
         """Execute steps before applying transformations"""
         try:
@@ -27,6 +27,16 @@ class Migration_0_15_to_0_16(BaseMigration):
     - Rust 2024 edition upgrade
     """
     
+    DESCRIPTION = "Migrate Bevy project from version 0.15 to 0.16 - Comprehensive update with 100+ breaking changes"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+        "Cargo.toml"
+    )
+    
     @property
     def from_version(self) -> str:
         """Source Bevy version for this migration"""
@@ -37,11 +47,6 @@ class Migration_0_15_to_0_16(BaseMigration):
         """Target Bevy version for this migration"""
         return "0.16"
     
-    @property
-    def description(self) -> str:
-        """Human-readable description of this migration"""
-        return "Migrate Bevy project from version 0.15 to 0.16 - Comprehensive update with 100+ breaking changes"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         """
         Get the list of AST transformations for migrating from 0.15 to 0.16
@@ -860,22 +865,6 @@ fix: "EaseFunction::Steps($N, JumpAt::default())"
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        """
-        Get list of file patterns that this migration affects
-        
-        Returns:
-            List of glob patterns
-        """
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-            "Cargo.toml"
-        ]
-    
     def pre_migration_steps(self) -> bool:
         """Execute steps before applying transformations"""
         try:
@@ -26,6 +26,16 @@ class Migration_0_16_to_0_17(BaseMigration):
     - Updated input handling
     """
     
+    DESCRIPTION = "Migrate Bevy project from version 0.16 to 0.17 - Updates required components, observers, asset system, and UI improvements"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",           # All Rust source files
+        "src/**/*.rs",       # Source files specifically
+        "examples/**/*.rs",  # Example files
+        "benches/**/*.rs",   # Benchmark files
+        "tests/**/*.rs",     # Test files
+        "Cargo.toml"         # Cargo manifest for dependency updates
+    )
+    
     @property
     def from_version(self) -> str:
         """Source Bevy version for this migration"""
@@ -36,11 +46,6 @@ class Migration_0_16_to_0_17(BaseMigration):
         """Target Bevy version for this migration"""
         return "0.17"
     
-    @property
-    def description(self) -> str:
-        """Human-readable description of this migration"""
-        return "Migrate Bevy project from version 0.16 to 0.17 - Updates required components, observers, asset system, and UI improvements"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         """
         Get the list of AST transformations for migrating from 0.16 to 0.17
@@ -210,22 +215,6 @@ class Migration_0_16_to_0_17(BaseMigration):
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        """
-        Get list of file patterns that this migration affects
-        
-        Returns:
-            List of glob patterns
-        """
-        return [
-            "**/*.rs",           # All Rust source files
-            "src/**/*.rs",       # Source files specifically
-            "examples/**/*.rs",  # Example files
-            "benches/**/*.rs",   # Benchmark files
-            "tests/**/*.rs",     # Test files
-            "Cargo.toml"         # Cargo manifest for dependency updates
-        ]
-    
     def pre_migration_steps(self) -> bool:
         """
         Execute steps before applying transformations
@@ -26,6 +26,15 @@ class Migration_0_16_to_0_17_Part1(BaseMigration):
     - Handle::Weak → Handle::Uuid
     """
     
+    DESCRIPTION = "Bevy 0.16 → 0.17 Part 1: Event/Message split, Observer API, Core ECS (~50 transformations)"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+    )
+    
     @property
     def from_version(self) -> str:
         return "0.16"
@@ -34,10 +43,6 @@ class Migration_0_16_to_0_17_Part1(BaseMigration):
     def to_version(self) -> str:
         return "0.17-part1"
     
-    @property
-    def description(self) -> str:
-        return "Bevy 0.16 → 0.17 Part 1: Event/Message split, Observer API, Core ECS (~50 transformations)"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         transformations = []
         
@@ -314,15 +319,6 @@ class Migration_0_16_to_0_17_Part1(BaseMigration):
         
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-        ]
-    
     def pre_migration_steps(self) -> bool:
         try:
             self.logger.info("=" * 60)
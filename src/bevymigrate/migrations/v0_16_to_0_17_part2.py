@@ -26,6 +26,15 @@ class Migration_0_16_to_0_17_Part2(BaseMigration):
     - UI rendering separated
     """
 
+    DESCRIPTION = "Bevy 0.16 → 0.17 Part 2: bevy_render reorganization, System Set renames (~50 transformations)"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+    )
+
     @property
     def from_version(self) -> str:
         return "0.17-part1"
@@ -34,10 +43,6 @@ class Migration_0_16_to_0_17_Part2(BaseMigration):
     def to_version(self) -> str:
         return "0.17-part2"
 
-    @property
-    def description(self) -> str:
-        return "Bevy 0.16 → 0.17 Part 2: bevy_render reorganization, System Set renames (~50 transformations)"
-
     def get_transformations(self) -> List[ASTTransformation]:
         transformations = []
 
@@ -388,15 +393,6 @@ class Migration_0_16_to_0_17_Part2(BaseMigration):
 
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-        ]
-    
     def pre_migration_steps(self) -> bool:
         try:
             self.logger.info("=" * 60)
@@ -29,6 +29,16 @@ class Migration_0_16_to_0_17_Part3(BaseMigration):
     - Cargo.toml update to 0.17
     """
 
+    DESCRIPTION = "Bevy 0.16 → 0.17 Part 3 (FINAL): Entity representation, UI transform, misc changes + Cargo.toml update"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+        "Cargo.toml",
+    )
+
     @property
     def from_version(self) -> str:
         return "0.17-part2"
@@ -37,10 +47,6 @@ class Migration_0_16_to_0_17_Part3(BaseMigration):
     def to_version(self) -> str:
         return "0.17"
 
-    @property
-    def description(self) -> str:
-        return "Bevy 0.16 → 0.17 Part 3 (FINAL): Entity representation, UI transform, misc changes + Cargo.toml update"
-
     def get_transformations(self) -> List[ASTTransformation]:
         transformations = []
 
@@ -320,16 +326,6 @@ class Migration_0_16_to_0_17_Part3(BaseMigration):
 
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-            "Cargo.toml",
-        ]
-    
     def pre_migration_steps(self) -> bool:
         try:
             self.logger.info("=" * 60)
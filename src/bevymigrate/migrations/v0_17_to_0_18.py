@@ -6,7 +6,7 @@ Comprehensive migration covering 80+ breaking changes
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from bevymigrate.migrations.base_migration import BaseMigration, MigrationResult
 from bevymigrate.core.ast_processor import ASTTransformation
@@ -29,6 +29,16 @@ class Migration_0_17_to_0_18(BaseMigration):
     - Feature renames and many API refinements
     """
     
+    DESCRIPTION = "Bevy 0.17 → 0.18: RenderTarget component, Entity API, Mesh try_* methods, BorderRadius, and 80+ changes"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+        "Cargo.toml",
+    )
+    
     @property
     def from_version(self) -> str:
         return "0.17"
@@ -37,10 +47,6 @@ class Migration_0_17_to_0_18(BaseMigration):
     def to_version(self) -> str:
         return "0.18"
     
-    @property
-    def description(self) -> str:
-        return "Bevy 0.17 → 0.18: RenderTarget component, Entity API, Mesh try_* methods, BorderRadius, and 80+ changes"
-    
     def get_transformations(self) -> List[ASTTransformation]:
         transformations = []
 
@@ -780,16 +786,6 @@ rule:
 
         return transformations
     
-    def get_affected_patterns(self) -> List[str]:
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-            "Cargo.toml",
-        ]
-    
     def pre_migration_steps(self) -> bool:
         try:
             self.logger.info("=" * 60)
@@ -7,6 +7,16 @@ from bevymigrate.migrations.base_migration import BaseMigration
 
 
 class Migration_0_18_to_0_19_Part1(BaseMigration):
+    DESCRIPTION = "Bevy 0.18 → 0.19 Part 1: Messages API, observer renames, reflect reorg, and core renames"
+    AFFECTED_PATTERNS = (
+        "**/*.rs",
+        "src/**/*.rs",
+        "examples/**/*.rs",
+        "benches/**/*.rs",
+        "tests/**/*.rs",
+        "Cargo.toml",
+    )
+
     @property
     def from_version(self) -> str:
         return "0.18"
@@ -15,10 +25,6 @@ class Migration_0_18_to_0_19_Part1(BaseMigration):
     def to_version(self) -> str:
         return "0.19-part1"
 
-    @property
-    def description(self) -> str:
-        return "Bevy 0.18 → 0.19 Part 1: Messages API, observer renames, reflect reorg, and core renames"
-
     def get_transformations(self) -> List[ASTTransformation]:
         transformations = []
 
@@ -233,13 +239,3 @@ rule:
         ))
 
         return transformations
-
-    def get_affected_patterns(self) -> List[str]:
-        return [
-            "**/*.rs",
-            "src/**/*.rs",
-            "examples/**/*.rs",
-            "benches/**/*.rs",
-            "tests/**/*.rs",
-            "Cargo.toml",
-        ]
@@ -0,0 +1,33 @@
+"""
+File I/O - Shared helpers for writing project files safely
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+
+def write_text_atomic(file_path: Path, content: str) -> None:
+    """
+    Replace a file's text atomically
+    
+    Content is written to a sibling temporary file which then replaces the original,
+    so a failed write never leaves a half-written file behind. Text is written as-is
+    (newline=''), so line endings read with newline='' are preserved, and the file's
+    permission bits are kept. Symlinks are written through: their target is replaced
+    and the link itself stays in place.
+    
+    Args:
+        file_path: Existing file to overwrite
+        content: New text content
+    """
+    target = Path(os.path.realpath(file_path))
+    temp_path = target.with_name(f".{target.name}.bevymigrate.tmp")
+    try:
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        shutil.copymode(target, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -3,6 +3,7 @@ Version Detector - Utility for detecting current Bevy version in projects
 Analyzes Cargo.toml and source code to determine the current Bevy version
 """
 
+import functools
 import logging
 import re
 from pathlib import Path
@@ -10,6 +11,37 @@ from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
 
+@functools.lru_cache(maxsize=8)
+def _read_cargo(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a Cargo.toml; mtime and size are part of the key so edits miss the cache"""
+    # Decoded without newline translation so rewritten manifests keep their line endings
+    return Path(path_str).read_bytes().decode('utf-8')
+
+
+def read_cargo_toml(path: Path) -> str:
+    """
+    Read a Cargo.toml, reusing the text while the file is unchanged on disk
+    
+    Args:
+        path: Path to the Cargo.toml file
+        
+    Returns:
+        The file content
+    """
+    st = path.stat()
+    return _read_cargo(str(path), st.st_mtime_ns, st.st_size)
+
+
+def invalidate_cargo_cache() -> None:
+    """
+    Forget the Cargo.toml contents cached by read_cargo_toml
+    
+    Call this after rewriting a manifest: a rewrite within the filesystem's timestamp
+    granularity that keeps the size would otherwise still hit the old entry.
+    """
+    _read_cargo.cache_clear()
+
+
 @dataclass
 class VersionInfo:
     """Information about detected Bevy version"""
@@ -151,7 +183,7 @@ class VersionDetector:
             if not cargo_toml_path:
                 return None
             
-            content = cargo_toml_path.read_text(encoding='utf-8')
+            content = read_cargo_toml(cargo_toml_path)
             
             for pattern in self.cargo_patterns:
                 match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
@@ -274,7 +306,7 @@ class VersionDetector:
             while current_path != current_path.parent:
                 workspace_cargo = self._find_cargo_toml(current_path)
                 if workspace_cargo:
-                    content = workspace_cargo.read_text(encoding='utf-8')
+                    content = read_cargo_toml(workspace_cargo)
                     if '[workspace]' in content:
                         # This is a workspace, check for bevy dependency
                         for pattern in self.cargo_patterns:
@@ -490,7 +522,7 @@ class VersionDetector:
                 
                 # Check Cargo.toml content
                 try:
-                    content = cargo_toml_path.read_text(encoding='utf-8')
+                    content = read_cargo_toml(cargo_toml_path)
                     validation["has_bevy_dependency"] = 'bevy' in content.lower()
                     validation["is_workspace"] = '[workspace]' in content
                 except Exception:
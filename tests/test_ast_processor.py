@@ -0,0 +1,318 @@
+import ntpath
+import sys
+from pathlib import Path
+import unittest
+import tempfile
+import shutil
+from unittest import mock
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bevymigrate.core.ast_processor import ASTProcessor, ASTTransformation
+
+class TestASTProcessorRegexFallback(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.processor = ASTProcessor(project_path=Path(self.test_dir), dry_run=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_compiled_regex_is_reused(self):
+        transformation = ASTTransformation(
+            pattern="Foo::new($A)",
+            replacement="Bar::new($A)",
+            description="Rename Foo"
+        )
+        result = self.processor._apply_regex_transformation("let x = Foo::new(1);", transformation)
+        self.assertEqual(result, "let x = Bar::new(1);")
+
+        compiled = transformation._compiled_regex
+        self.assertIsNotNone(compiled)
+
+        result = self.processor._apply_regex_transformation("let y = Foo::new(2);", transformation)
+        self.assertEqual(result, "let y = Bar::new(2);")
+        self.assertIs(transformation._compiled_regex, compiled)
+
+    def test_validate_transformations_stops_at_first_invalid(self):
+        valid = ASTTransformation(pattern="Foo::new($A)", replacement="Bar::new($A)", description="Rename Foo")
+        empty = ASTTransformation(pattern=" ", replacement="Bar", description="Empty pattern")
+        later = ASTTransformation(pattern="Baz", replacement="", description="Empty replacement")
+
+        self.assertIsNone(self.processor.validate_transformations([valid]))
+        self.assertIsNotNone(valid._compiled_regex)
+        self.assertIs(self.processor.validate_transformations([valid, empty, later]), empty)
+        self.assertIs(self.processor.validate_transformations([valid, later]), later)
+
+    def test_metavariables_with_underscores_and_repeats(self):
+        transformation = ASTTransformation(
+            pattern="$MESH.merge($OTHER_MESH)",
+            replacement="$MESH.merge(&$OTHER_MESH)",
+            description="Borrow merged mesh"
+        )
+        result = self.processor._apply_regex_transformation("a.merge(b);", transformation)
+        self.assertEqual(result, "a.merge(&b);")
+
+        transformation = ASTTransformation(
+            pattern="swap($A, $A, $AB)",
+            replacement="swap2($AB, $A)",
+            description="Swap"
+        )
+        result = self.processor._apply_regex_transformation("swap(x, x, y)", transformation)
+        self.assertEqual(result, "swap2(y, x)")
+
+    def test_literal_pattern_uses_plain_replace(self):
+        transformation = ASTTransformation(
+            pattern="Camera2dBundle::default()",
+            replacement="Camera2d",
+            description="Replace Camera2dBundle"
+        )
+        self.assertTrue(transformation._is_literal)
+        result = self.processor._apply_regex_transformation("spawn(Camera2dBundle::default())", transformation)
+        self.assertEqual(result, "spawn(Camera2d)")
+        self.assertIsNone(transformation._compiled_regex)
+
+        self.assertFalse(ASTTransformation("Foo::new($A)", "Bar::new($A)", "Rename Foo")._is_literal)
+        self.assertFalse(ASTTransformation("let x", "let y", "Rename x")._is_literal)
+
+    def test_convert_pattern_to_regex(self):
+        regex = self.processor._convert_ast_pattern_to_regex("foo($AB,  $$$REST) + $A")
+        self.assertEqual(regex, r"foo\(([^()<>:]+?),\s+(.*)\)\s+\+\s+([^()<>:]+?)")
+
+class TestASTProcessorLiteralPrefilter(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.processor = ASTProcessor(project_path=Path(self.test_dir), dry_run=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_required_literals_skip_metavariables(self):
+        transformation = ASTTransformation(
+            pattern="asset_server.load::<$_>($PATH, $$$REST)",
+            replacement="asset_server.load($PATH)",
+            description="Drop turbofish"
+        )
+        self.assertEqual(transformation._required_literals, ("asset_server", "load"))
+        self.assertEqual(transformation._required_literal_bytes, (b"asset_server", b"load"))
+
+    def test_missing_literal_skips_transformation(self):
+        transformation = ASTTransformation(
+            pattern="Camera2dBundle::default()",
+            replacement="Camera2d",
+            description="Replace Camera2dBundle"
+        )
+        content = "fn setup() { let x = Camera3d::default(); }"
+        self.assertEqual(self.processor._apply_single_transformation(content, transformation, Path("a.rs")), content)
+
+        content = "fn setup() { commands.spawn(Camera2dBundle::default()); }"
+        self.assertEqual(
+            self.processor._apply_single_transformation(content, transformation, Path("a.rs")),
+            "fn setup() { commands.spawn(Camera2d); }"
+        )
+
+class TestASTProcessorPreview(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.processor = ASTProcessor(project_path=Path(self.test_dir), dry_run=True)
+        self.transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="NewName",
+            description="Rename OldName"
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_preview_diff_matches_difflib(self):
+        import difflib
+        original_lines = [f"let v{i} = {i};" for i in range(20)]
+        transformed_lines = list(original_lines)
+        original_lines[10] = "let x = OldName;"
+        transformed_lines[10] = "let x = NewName;"
+        content = "\n".join(original_lines)
+
+        preview = self.processor.get_transformation_preview(content, self.transformation)
+
+        self.assertTrue(preview["has_changes"])
+        self.assertEqual(preview["diff"], list(difflib.unified_diff(
+            original_lines,
+            transformed_lines,
+            fromfile="original",
+            tofile="transformed",
+            lineterm=""
+        )))
+
+    def test_preview_without_changes_has_empty_diff(self):
+        preview = self.processor.get_transformation_preview("let x = 1;", self.transformation)
+        self.assertFalse(preview["has_changes"])
+        self.assertEqual(preview["diff"], [])
+
+class TestASTProcessorApplyTransformations(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_file_patterns_use_normcase(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True)
+        with mock.patch("os.path.normcase", ntpath.normcase):
+            transformation = ASTTransformation(
+                pattern="OldName",
+                replacement="NewName",
+                description="Rename OldName",
+                file_patterns=["src/*.rs"]
+            )
+            file_path = self.project_path / "SRC" / "Main.RS"
+            self.assertTrue(processor._should_apply_transformation(file_path, transformation, "SRC\\Main.RS"))
+            self.assertFalse(processor._should_apply_transformation(file_path, transformation, "lib\\Main.RS"))
+
+    def test_relative_path_matches_relative_to(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True)
+        for file_path in [self.project_path / "src" / "main.rs", self.project_path / "build.rs"]:
+            self.assertEqual(processor.relative_path(file_path), str(file_path.relative_to(self.project_path)))
+        with self.assertRaises(ValueError):
+            processor.relative_path(Path(self.test_dir + "x") / "main.rs")
+
+    def test_results_preserve_file_order(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True, max_workers=4)
+        transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="NewName",
+            description="Rename OldName"
+        )
+        file_paths = []
+        for i in range(8):
+            file_path = self.project_path / f"file_{i}.rs"
+            file_path.write_text("struct Other;" if i % 2 else "struct OldName;")
+            file_paths.append(file_path)
+
+        results = processor.apply_transformations(file_paths, [transformation])
+
+        self.assertEqual([r.file_path for r in results], file_paths)
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(results[0].transformed_content, "struct NewName;")
+        self.assertTrue(results[0].modified)
+        self.assertFalse(results[1].modified)
+        # Files no transformation can match are skipped without being decoded
+        self.assertEqual(results[1].applied_transformations, [])
+        self.assertEqual(results[1].original_content, results[1].transformed_content)
+
+    def test_statistics_of_applied_transformations(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True)
+        transformation = ASTTransformation(pattern="OldName", replacement="NewName", description="Rename OldName")
+        file_paths = []
+        for i, content in enumerate(["struct OldName;", "struct Other;", "struct OldName;"]):
+            file_path = self.project_path / f"file_{i}.rs"
+            file_path.write_text(content)
+            file_paths.append(file_path)
+        missing = self.project_path / "missing.rs"
+
+        stats = processor.get_statistics(processor.apply_transformations(file_paths + [missing], [transformation]))
+
+        self.assertEqual(stats["total_files"], 4)
+        self.assertEqual(stats["successful_files"], 3)
+        self.assertEqual(stats["failed_files"], 1)
+        self.assertEqual(stats["modified_files"], 2)
+        self.assertEqual(stats["transformation_counts"], {"Rename OldName": 2})
+        self.assertEqual(stats["success_rate"], 0.75)
+
+    def test_identical_files_share_transformation_result(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True, max_workers=1)
+        transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="NewName",
+            description="Rename OldName"
+        )
+        file_paths = []
+        for name in ("a.rs", "b.rs"):
+            file_path = self.project_path / name
+            file_path.write_text("struct OldName;")
+            file_paths.append(file_path)
+
+        with mock.patch.object(
+            ASTProcessor, "_apply_single_transformation", autospec=True,
+            side_effect=ASTProcessor._apply_single_transformation
+        ) as apply_single:
+            results = processor.apply_transformations(file_paths, [transformation])
+
+        self.assertEqual(apply_single.call_count, 1)
+        self.assertEqual([r.transformed_content for r in results], ["struct NewName;"] * 2)
+        self.assertEqual(results[1].applied_transformations, ["Rename OldName"])
+
+    def test_identical_files_with_callback_transformed_per_path(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True, max_workers=1)
+        calls = []
+
+        def callback(vars, file_path, match):
+            calls.append(file_path)
+            return f"{file_path.stem.upper()}Name"
+
+        transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="",
+            description="Rename OldName",
+            callback=callback
+        )
+        file_paths = []
+        for name in ("a.rs", "b.rs"):
+            file_path = self.project_path / name
+            file_path.write_text("struct OldName;")
+            file_paths.append(file_path)
+
+        results = processor.apply_transformations(file_paths, [transformation])
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual([r.transformed_content for r in results], ["struct AName;", "struct BName;"])
+
+    def test_results_without_content(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True)
+        transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="NewName",
+            description="Rename OldName"
+        )
+        file_path = self.project_path / "main.rs"
+        file_path.write_text("struct OldName;")
+
+        result = processor.apply_transformations([file_path], [transformation], keep_content=False)[0]
+
+        self.assertTrue(result.modified)
+        self.assertEqual(result.applied_transformations, ["Rename OldName"])
+        self.assertEqual((result.original_content, result.transformed_content), ("", ""))
+
+    def test_binary_file_is_skipped(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=True)
+        transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="NewName",
+            description="Rename OldName"
+        )
+        file_path = self.project_path / "blob.rs"
+        file_path.write_bytes(b"OldName\0\xff\xfe")
+
+        results = processor.apply_transformations([file_path], [transformation])
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].applied_transformations, [])
+
+    def test_changed_file_is_replaced_in_place(self):
+        processor = ASTProcessor(project_path=self.project_path, dry_run=False)
+        transformation = ASTTransformation(
+            pattern="OldName",
+            replacement="NewName",
+            description="Rename OldName"
+        )
+        file_path = self.project_path / "main.rs"
+        file_path.write_bytes(b"struct OldName;\r\n")
+
+        processor.apply_transformations([file_path], [transformation])
+
+        self.assertEqual(file_path.read_bytes(), b"struct NewName;\r\n")
+        self.assertEqual(sorted(p.name for p in self.project_path.iterdir()), ["main.rs"])
+
+if __name__ == "__main__":
+    unittest.main()
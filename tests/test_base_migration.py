@@ -0,0 +1,208 @@
+import sys
+from pathlib import Path
+import unittest
+import tempfile
+import shutil
+from unittest import mock
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bevymigrate.core.ast_processor import ASTProcessor
+from bevymigrate.core.file_manager import FileManager
+from bevymigrate.core.transform_cache import CACHE_DIR_NAME
+from bevymigrate.migrations.base_migration import BaseMigration
+
+
+class RenameMigration(BaseMigration):
+    DESCRIPTION = "Rename OldThing to NewThing"
+    AFFECTED_PATTERNS = ("**/*.rs",)
+
+    @property
+    def from_version(self) -> str:
+        return "0.1"
+
+    @property
+    def to_version(self) -> str:
+        return "0.2"
+
+    def get_transformations(self):
+        return [
+            self.create_transformation(
+                pattern="OldThing",
+                replacement="NewThing",
+                description="OldThing renamed to NewThing",
+            )
+        ]
+
+
+class TestBaseMigration(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.test_dir)
+        (self.project_path / "Cargo.toml").write_text('[dependencies]\nbevy = "0.1"\n')
+        self.sources = {}
+        for index in range(10):
+            relative = f"src/m{index}.rs"
+            content = f"fn m{index}() {{ {'OldThing' if index % 2 == 0 else 'Other'}::new(); }}\n"
+            self.sources[relative] = content
+            path = self.project_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        self.file_manager = FileManager(project_path=self.project_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def make_migration(self, **kwargs):
+        return RenameMigration(project_path=self.project_path, file_manager=self.file_manager, **kwargs)
+
+    def test_execute_with_worker_threads(self):
+        migration = self.make_migration(max_workers=4)
+        self.assertEqual(migration.ast_processor.max_workers, 4)
+
+        result = migration._apply_transformations(migration._get_files_to_process())
+        self.assertTrue(result.success)
+        self.assertEqual(result.files_processed, 10)
+        self.assertEqual(result.files_modified, 5)
+        self.assertEqual(result.transformations_applied, 5)
+        self.assertFalse(hasattr(result, "__dict__"))
+        for relative, content in self.sources.items():
+            self.assertEqual(
+                (self.project_path / relative).read_text(),
+                content.replace("OldThing", "NewThing"),
+                relative,
+            )
+
+    def test_files_to_process_deduplicated(self):
+        migration = self.make_migration()
+        migration.get_affected_patterns = lambda: ["src/*.rs", "**/*.rs", "Cargo.toml"]
+        files = migration._get_files_to_process()
+        self.assertEqual(len(files), 11)
+        self.assertEqual(len(set(files)), 11)
+        self.assertEqual(
+            [str(path.relative_to(self.project_path)) for path in files[-2:]],
+            [str(Path("src") / "m9.rs"), "Cargo.toml"],
+        )
+
+    def test_transformations_built_once(self):
+        migration = self.make_migration(dry_run=True)
+        with mock.patch.object(
+            RenameMigration, "get_transformations", autospec=True,
+            side_effect=RenameMigration.get_transformations
+        ) as get_transformations:
+            self.assertTrue(migration.execute())
+            migration.preview_changes()
+            self.assertEqual(migration.get_migration_info()["transformation_count"], 1)
+            self.assertEqual(get_transformations.call_count, 1)
+
+            migration.invalidate_caches()
+            migration.get_migration_info()
+            self.assertEqual(get_transformations.call_count, 2)
+
+    def test_backup_files(self):
+        files = self.make_migration()._get_files_to_process()
+        self.assertTrue(self.make_migration().backup_files(files))
+        backup_dir = self.project_path / "migration_backup" / "0.1_to_0.2"
+        for relative, content in self.sources.items():
+            self.assertEqual((backup_dir / relative).read_text(), content)
+
+        self.assertFalse(self.make_migration().backup_files(files + [self.project_path / "src" / "missing.rs"]))
+        self.assertTrue(self.make_migration(dry_run=True).backup_files(files))
+
+    def test_modified_files_logged_once(self):
+        migration = self.make_migration(dry_run=True, use_cache=False)
+        migration.MODIFIED_FILES_LOGGED = 2
+        with self.assertLogs(migration.logger, level="INFO") as logs:
+            migration._apply_transformations(migration._get_files_to_process())
+        self.assertEqual(len(logs.records), 1)
+        self.assertRegex(logs.output[0], r"Modified 5 files: .*m0\.rs, .*m2\.rs \(and 3 more\)$")
+
+    def test_preview_reads_only_targeted_files(self):
+        (self.project_path / "build.rs").write_text("fn main() { OldThing::new(); }\n")
+        migration = self.make_migration(dry_run=True)
+        migration.get_transformations = lambda: [
+            migration.create_transformation(
+                pattern="OldThing",
+                replacement="NewThing",
+                description="OldThing renamed to NewThing",
+                file_patterns=["src/*.rs"],
+            )
+        ]
+        with mock.patch.object(
+            FileManager, "read_file_content", autospec=True,
+            side_effect=FileManager.read_file_content
+        ) as read_content:
+            preview = migration.preview_changes(max_files=20)
+        self.assertEqual(preview["total_files_to_process"], 11)
+        self.assertEqual(read_content.call_count, 10)
+        self.assertEqual(
+            [entry["file_path"] for entry in preview["file_previews"]],
+            [str(Path("src") / f"m{index}.rs") for index in range(0, 10, 2)],
+        )
+
+    def test_files_to_process_cached_until_execute(self):
+        migration = self.make_migration(dry_run=True)
+        with mock.patch.object(
+            FileManager, "find_files_by_pattern", autospec=True,
+            side_effect=FileManager.find_files_by_pattern
+        ) as find_files:
+            files = migration._get_files_to_process()
+            self.assertEqual(len(files), 10)
+            files.clear()
+            preview = migration.preview_changes(max_files=2)
+            self.assertEqual(preview["total_files_to_process"], 10)
+            self.assertEqual(find_files.call_count, 1)
+
+            (self.project_path / "src" / "later.rs").write_text("fn later() {}\n")
+            self.file_manager.invalidate_cache()
+            self.assertEqual(len(migration._get_files_to_process()), 10)
+            self.assertTrue(migration.execute())
+            self.assertEqual(find_files.call_count, 2)
+        self.assertEqual(len(migration._get_files_to_process()), 11)
+
+    def test_transform_cache_reused_across_runs(self):
+        files = self.make_migration()._get_files_to_process()
+        with mock.patch.object(
+            ASTProcessor, "_apply_single_transformation", autospec=True,
+            side_effect=ASTProcessor._apply_single_transformation
+        ) as apply_single:
+            first = self.make_migration()._apply_transformations(files)
+            self.assertEqual(apply_single.call_count, 5)
+            self.assertTrue((self.project_path / CACHE_DIR_NAME).is_dir())
+
+            # Re-run over the original sources, e.g. after restoring a backup
+            for relative, content in self.sources.items():
+                (self.project_path / relative).write_text(content)
+            second = self.make_migration()._apply_transformations(files)
+            self.assertEqual(apply_single.call_count, 5)
+
+        self.assertEqual(
+            (second.files_modified, second.transformations_applied),
+            (first.files_modified, first.transformations_applied),
+        )
+        for relative, content in self.sources.items():
+            self.assertEqual((self.project_path / relative).read_text(), content.replace("OldThing", "NewThing"))
+        self.assertNotIn(CACHE_DIR_NAME, str(self.file_manager.find_files_by_pattern("**/*")))
+
+    def test_transform_cache_fingerprint_covers_backend(self):
+        migration = self.make_migration()
+        fingerprint = migration._transformations_fingerprint()
+        self.assertEqual(self.make_migration()._transformations_fingerprint(), fingerprint)
+        with mock.patch.object(ASTProcessor, "backend_version", return_value="ast-grep-py 0.0.0"):
+            self.assertNotEqual(migration._transformations_fingerprint(), fingerprint)
+
+    def test_transform_cache_not_used_in_dry_run(self):
+        migration = self.make_migration(dry_run=True)
+        self.assertTrue(migration.execute())
+        self.assertFalse((self.project_path / CACHE_DIR_NAME).exists())
+
+    def test_transform_cache_disabled(self):
+        migration = self.make_migration(dry_run=True, use_cache=False)
+        result = migration._apply_transformations(migration._get_files_to_process())
+        self.assertEqual(result.files_modified, 5)
+        self.assertFalse((self.project_path / CACHE_DIR_NAME).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+import unittest
+import tempfile
+import shutil
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bevymigrate.utils.file_io import write_text_atomic
+
+
+class TestWriteTextAtomic(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_keeps_line_endings_and_mode(self):
+        file_path = self.project_path / "main.rs"
+        file_path.write_bytes(b"fn main() {}\r\n")
+        file_path.chmod(0o640)
+        write_text_atomic(file_path, "fn main() { run(); }\r\n")
+        self.assertEqual(file_path.read_bytes(), b"fn main() { run(); }\r\n")
+        self.assertEqual(file_path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual([path.name for path in self.project_path.iterdir()], ["main.rs"])
+
+    def test_writes_through_symlink(self):
+        target = self.project_path / "real" / "a.rs"
+        target.parent.mkdir()
+        target.write_text("fn old() {}\n")
+        link = self.project_path / "link.rs"
+        link.symlink_to(Path("real") / "a.rs")
+
+        write_text_atomic(link, "fn new() {}\n")
+
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(target.read_text(), "fn new() {}\n")
+        self.assertEqual(sorted(path.name for path in target.parent.iterdir()), ["a.rs"])
+
+
+if __name__ == '__main__':
+    unittest.main()
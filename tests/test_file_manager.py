@@ -0,0 +1,275 @@
+import sys
+from pathlib import Path
+import unittest
+import tempfile
+import shutil
+from unittest import mock
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bevymigrate.core import file_manager as file_manager_module
+from bevymigrate.core.file_manager import FileManager
+
+
+class TestFileManagerWalk(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.test_dir)
+        for relative in [
+            "Cargo.toml",
+            "Cargo.lock",
+            "src/main.rs",
+            "src/a/lib.rs",
+            "src/Cargo.toml",
+            "examples/x/demo.rs",
+            "a-b/q.rs",
+            "target/debug/build.rs",
+            ".git/hooks/hook.rs",
+            "migration_backup/old.rs",
+            "notes.tmp",
+        ]:
+            path = self.project_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("fn main() {}\n")
+        self.file_manager = FileManager(project_path=self.project_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def relative(self, paths):
+        return [str(path.relative_to(self.project_path)).replace('\\', '/') for path in paths]
+
+    def test_find_rust_files_prunes_excluded_directories(self):
+        self.assertEqual(
+            self.relative(self.file_manager.find_rust_files()),
+            ["a-b/q.rs", "examples/x/demo.rs", "src/a/lib.rs", "src/main.rs"],
+        )
+
+    def test_find_files_by_pattern_matches_rglob(self):
+        for pattern in ["**/*.rs", "src/**/*.rs", "examples/**/*.rs", "Cargo.toml", "[!m]*.rs", "a?b/*"]:
+            expected = sorted(
+                path for path in self.project_path.rglob(pattern)
+                if path.is_file() and self.file_manager._should_include_file(path)
+            )
+            self.assertEqual(self.file_manager.find_files_by_pattern(pattern), expected, pattern)
+
+    def test_iter_files_stream_and_fill_walk_cache(self):
+        first = next(self.file_manager.iter_rust_files())
+        self.assertTrue(first.name.endswith(".rs"))
+        self.assertIsNone(self.file_manager._walk_cache)
+
+        self.assertEqual(sorted(self.file_manager.iter_rust_files()), self.file_manager.find_rust_files())
+        self.assertIsNotNone(self.file_manager._walk_cache)
+        self.assertEqual(sorted(self.file_manager.iter_cargo_files()), self.file_manager.find_cargo_files())
+        self.assertEqual(sorted(self.file_manager.iter_config_files()), self.file_manager.find_config_files())
+
+    def test_cargo_and_config_files(self):
+        self.assertEqual(
+            self.relative(self.file_manager.find_cargo_files()),
+            ["Cargo.toml", "src/Cargo.toml"],
+        )
+        self.assertEqual(
+            self.relative(self.file_manager.find_config_files()),
+            ["Cargo.toml", "src/Cargo.toml"],
+        )
+
+    def test_user_exclude_patterns(self):
+        file_manager = FileManager(project_path=self.project_path, exclude_patterns=["examples/**", "lib.rs"])
+        self.assertEqual(self.relative(file_manager.find_rust_files()), ["a-b/q.rs", "src/main.rs"])
+        self.assertFalse(file_manager._should_include_file(self.project_path / "notes.tmp"))
+        self.assertTrue(file_manager._should_include_file(self.project_path / "src" / "main.rs"))
+        self.assertTrue(file_manager.is_excluded("examples/x/demo.rs"))
+        self.assertTrue(file_manager.is_excluded("src/a/lib.rs"))
+        self.assertTrue(file_manager.is_excluded("target/debug/build.rs"))
+        self.assertFalse(file_manager.is_excluded("src/main.rs"))
+
+    def test_file_statistics_single_pass(self):
+        (self.project_path / "src" / "main.rs").write_text("fn main() { println!(\"hello\"); }\n")
+        stats = self.file_manager.get_file_statistics()
+        self.assertEqual(stats["total_files"], 6)
+        self.assertEqual(stats["rust_files"], 4)
+        self.assertEqual(stats["cargo_files"], 2)
+        self.assertEqual(stats["config_files"], 2)
+        self.assertEqual(stats["largest_file"].relative_path, Path("src/main.rs"))
+
+    def test_find_files_containing_patterns(self):
+        (self.project_path / "src" / "main.rs").write_text("fn main() { EventWriter::new(); }\n")
+        (self.project_path / "a-b" / "q.rs").write_text("use bevy::prelude::Trigger<T>;\n")
+        self.assertEqual(
+            self.relative(self.file_manager.find_files_containing_pattern("EventWriter")),
+            ["src/main.rs"],
+        )
+        self.assertEqual(
+            self.relative(self.file_manager.find_files_containing_patterns(["EventWriter", "Trigger<", "Missing"])),
+            ["a-b/q.rs", "src/main.rs"],
+        )
+        self.assertEqual(self.file_manager.find_files_containing_patterns(["Missing"]), [])
+
+    def test_find_files_containing_pattern_skips_empty_and_binary(self):
+        (self.project_path / "src" / "main.rs").write_text("")
+        (self.project_path / "a-b" / "q.rs").write_bytes(b"fn main() {}\n\xff\xfe")
+        self.assertEqual(
+            self.relative(self.file_manager.find_files_containing_pattern("fn main")),
+            ["examples/x/demo.rs", "src/a/lib.rs"],
+        )
+        self.assertEqual(
+            self.relative(self.file_manager.find_files_containing_pattern("{}\n")),
+            ["examples/x/demo.rs", "src/a/lib.rs"],
+        )
+
+    def test_parallel_search_and_validation(self):
+        generated = []
+        for index in range(12):
+            path = self.project_path / "src" / "gen" / f"m{index}.rs"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"fn m{index}() {{ {'Marker' if index % 3 == 0 else 'Other'}(); }}\n")
+            generated.append(path)
+        self.file_manager.invalidate_cache()
+
+        self.assertEqual(
+            self.relative(self.file_manager.find_files_containing_pattern("Marker")),
+            ["src/gen/m0.rs", "src/gen/m3.rs", "src/gen/m6.rs", "src/gen/m9.rs"],
+        )
+
+        missing = self.project_path / "src" / "missing.rs"
+        status = self.file_manager.validate_file_access(generated + [missing])
+        self.assertEqual(list(status), generated + [missing])
+        self.assertTrue(all(status[path] for path in generated))
+        self.assertFalse(status[missing])
+
+    def test_read_file_content_cache(self):
+        file_path = self.project_path / "src" / "main.rs"
+        with mock.patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+            self.assertEqual(self.file_manager.read_file_content(file_path), "fn main() {}\n")
+            self.assertEqual(self.file_manager.read_file_content(file_path), "fn main() {}\n")
+            self.assertEqual(read_bytes.call_count, 1)
+
+            file_path.write_text("fn main() { changed(); }\n")
+            self.assertEqual(self.file_manager.read_file_content(file_path), "fn main() { changed(); }\n")
+            self.assertEqual(read_bytes.call_count, 2)
+
+            self.file_manager.write_file_content(file_path, "fn other() {}\n", create_backup=False)
+            self.assertEqual(self.file_manager.read_file_content(file_path), "fn other() {}\n")
+
+    def test_backup_and_restore_file(self):
+        file_path = self.project_path / "src" / "main.rs"
+        file_path.write_text("fn main() { original(); }\n")
+        file_path.chmod(0o640)
+        backup_dir = self.project_path / "migration_backup" / "manual"
+
+        backup_path = self.file_manager.backup_file(file_path, backup_dir)
+        self.assertEqual(backup_path, backup_dir / "src" / "main.rs")
+        self.assertEqual(backup_path.read_text(), "fn main() { original(); }\n")
+        self.assertEqual(backup_path.stat().st_mode, file_path.stat().st_mode)
+        self.assertEqual(backup_path.stat().st_mtime_ns, file_path.stat().st_mtime_ns)
+
+        with mock.patch.object(FileManager, "copy_file", autospec=True) as copy_file:
+            self.assertEqual(self.file_manager.backup_file(file_path, backup_dir), backup_path)
+            copy_file.assert_not_called()
+
+        file_path.write_text("fn main() { changed(); }\n")
+        self.assertTrue(self.file_manager.restore_file(backup_path, file_path))
+        self.assertEqual(self.file_manager.read_file_content(file_path), "fn main() { original(); }\n")
+
+    def test_backup_files_batch(self):
+        backup_dir = self.project_path / "migration_backup" / "batch"
+        sources = [self.project_path / "src" / "main.rs", self.project_path / "src" / "missing.rs"]
+        sources += [self.project_path / "src" / f"gen{index}.rs" for index in range(10)]
+        for source in sources[2:]:
+            source.write_text(f"fn {source.stem}() {{}}\n")
+
+        backups = self.file_manager.backup_files(sources, backup_dir)
+
+        self.assertIsNone(backups[1])
+        for source, backup in zip(sources[:1] + sources[2:], backups[:1] + backups[2:]):
+            self.assertEqual(backup, backup_dir / source.relative_to(self.project_path))
+            self.assertEqual(backup.read_text(), source.read_text())
+
+    def test_copy_file_falls_back_between_kernel_copies(self):
+        source = self.project_path / "src" / "main.rs"
+        source.write_bytes(b"fn main() { copied(); }\n" * 1000)
+        source.chmod(0o640)
+
+        def refuse(src_fd, dst_fd, count):
+            raise OSError("not supported")
+
+        used = []
+
+        def record(src_fd, dst_fd, count):
+            used.append(count)
+            return file_manager_module._sendfile(src_fd, dst_fd, count)
+
+        for index, kernel_copies in enumerate([[refuse, record], [refuse], []]):
+            destination = self.project_path / f"copy{index}.rs"
+            with mock.patch.object(file_manager_module, "_KERNEL_COPIES", kernel_copies):
+                self.file_manager.copy_file(source, destination)
+            self.assertEqual(destination.read_bytes(), source.read_bytes())
+            self.assertEqual(destination.stat().st_mode, source.stat().st_mode)
+            self.assertEqual(destination.stat().st_mtime_ns, source.stat().st_mtime_ns)
+        self.assertTrue(used)
+
+    def test_directory_structure(self):
+        structure = self.file_manager.get_directory_structure(max_depth=2)
+        children = structure["children"]
+        self.assertEqual(list(children), sorted(children))
+        self.assertEqual(children["target"], {"type": "directory", "children": {}, "child_count": 0})
+        self.assertNotIn("notes.tmp", children)
+        self.assertEqual(children["src"]["children"]["main.rs"]["is_rust"], True)
+        self.assertEqual(children["src"]["children"]["a"]["children"]["lib.rs"], {"type": "directory", "truncated": True})
+        self.assertEqual(children["Cargo.toml"]["is_cargo"], True)
+
+    def test_read_file_content_text_and_binary(self):
+        file_path = self.project_path / "src" / "main.rs"
+        file_path.write_bytes(b"fn main() {\r\n    run();\r}\n")
+        self.assertEqual(self.file_manager.read_file_content(file_path), file_path.read_text(encoding="utf-8"))
+
+        binary_path = self.project_path / "src" / "blob.rs"
+        binary_path.write_bytes(b"fn\0\x01\x02")
+        self.assertIsNone(self.file_manager.read_file_content(binary_path))
+        self.assertEqual(self.file_manager.read_file_bytes(binary_path), b"fn\0\x01\x02")
+
+        invalid_path = self.project_path / "src" / "latin1.rs"
+        invalid_path.write_bytes(b"// caf\xe9\n")
+        self.assertIsNone(self.file_manager.read_file_content(invalid_path))
+
+    def test_find_cargo_toml(self):
+        self.assertEqual(self.file_manager.find_cargo_toml(), self.project_path / "Cargo.toml")
+
+        (self.project_path / "Cargo.toml").unlink()
+        (self.project_path / "cargo.TOML").write_text("[package]\n")
+        self.assertEqual(self.file_manager.find_cargo_toml().name.lower(), "cargo.toml")
+
+        (self.project_path / "cargo.TOML").unlink()
+        self.assertIsNone(self.file_manager.find_cargo_toml())
+
+    def test_file_lists_cached_until_invalidated(self):
+        with mock.patch.object(FileManager, "_walk", autospec=True, side_effect=FileManager._walk) as walk:
+            first = self.file_manager.find_files_by_pattern("src/**/*.rs")
+            first.append(self.project_path / "extra.rs")
+            self.assertEqual(
+                self.relative(self.file_manager.find_files_by_pattern("src/**/*.rs")),
+                ["src/a/lib.rs", "src/main.rs"],
+            )
+            self.assertEqual(walk.call_count, 1)
+        self.assertEqual(self.file_manager.find_rust_files(), self.file_manager.find_rust_files())
+        self.assertEqual(self.file_manager.find_rust_files(sort=False), list(self.file_manager.iter_rust_files()))
+        self.assertEqual(
+            self.file_manager.find_files_by_pattern("**/*.rs", sort=False),
+            list(self.file_manager.iter_rust_files()),
+        )
+
+        (self.project_path / "src" / "later.rs").write_text("fn later() {}\n")
+        self.assertEqual(len(self.file_manager.find_rust_files()), 4)
+        self.file_manager.invalidate_cache()
+        self.assertEqual(len(self.file_manager.find_rust_files()), 5)
+        self.assertEqual(len(self.file_manager.find_files_by_pattern("src/**/*.rs")), 3)
+
+    def test_new_file_invalidates_walk(self):
+        self.assertEqual(len(self.file_manager.find_rust_files()), 4)
+        self.file_manager.write_file_content(self.project_path / "src" / "new.rs", "fn new() {}\n")
+        self.assertEqual(len(self.file_manager.find_rust_files()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
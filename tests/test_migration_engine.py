@@ -0,0 +1,259 @@
+import os
+import sys
+from pathlib import Path
+import unittest
+import tempfile
+import shutil
+from unittest import mock
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bevymigrate.core.migration_engine import BevyVersion, MigrationEngine, _load_migration_class
+from bevymigrate.migrations.base_migration import BaseMigration
+from bevymigrate.utils.version_detector import invalidate_cargo_cache
+
+
+class TestMigrationEngineProjectVersion(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.test_dir)
+        self.cargo_toml = self.project_path / "Cargo.toml"
+        self.engine = MigrationEngine(project_path=self.project_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_update_simple_dependency(self):
+        self.cargo_toml.write_text('[dependencies]\nbevy = "0.14"\nbevy_rapier = "0.27"\n')
+        self.engine._update_project_version("0.15-part1")
+        self.assertEqual(self.cargo_toml.read_text(), '[dependencies]\nbevy = "0.15"\nbevy_rapier = "0.27"\n')
+
+    def test_update_table_dependency(self):
+        self.cargo_toml.write_text(
+            "[dependencies]\nbevy = { default-features = false, version = '0.16.1', features = [\"x\"] }\n"
+        )
+        self.engine._update_project_version("0.17")
+        self.assertEqual(
+            self.cargo_toml.read_text(),
+            "[dependencies]\nbevy = { default-features = false, version = '0.17', features = [\"x\"] }\n",
+        )
+
+    def test_update_both_forms_atomically(self):
+        self.cargo_toml.write_text('[dependencies]\nbevy = "0.14"\n\n[dev-dependencies]\nbevy = { version = "0.14" }\n')
+        self.cargo_toml.chmod(0o640)
+        self.engine._update_project_version("0.15")
+        self.assertEqual(
+            self.cargo_toml.read_text(),
+            '[dependencies]\nbevy = "0.15"\n\n[dev-dependencies]\nbevy = { version = "0.15" }\n',
+        )
+        self.assertEqual(self.cargo_toml.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(sorted(path.name for path in self.project_path.iterdir()), ["Cargo.toml"])
+
+    def test_update_preserves_line_endings(self):
+        self.cargo_toml.write_bytes(b'[dependencies]\r\nbevy = "0.14"\r\n')
+        self.engine._update_project_version("0.15")
+        self.assertEqual(self.cargo_toml.read_bytes(), b'[dependencies]\r\nbevy = "0.15"\r\n')
+
+    def test_no_bevy_dependency_leaves_file_untouched(self):
+        self.cargo_toml.write_text('[dependencies]\nserde = "1"\n')
+        mtime = self.cargo_toml.stat().st_mtime_ns
+        self.engine._update_project_version("0.18")
+        self.assertEqual(self.cargo_toml.read_text(), '[dependencies]\nserde = "1"\n')
+        self.assertEqual(self.cargo_toml.stat().st_mtime_ns, mtime)
+
+    def test_validate_project_bevy_mention(self):
+        (self.project_path / "main.rs").write_text("fn main() {}\n")
+        self.cargo_toml.write_text('[dependencies]\nserde = "1"\n')
+        with self.assertLogs("bevymigrate.core.migration_engine", level="WARNING") as logs:
+            self.assertTrue(self.engine.validate_project())
+        self.assertIn("Bevy dependency not found", logs.output[0])
+
+        self.cargo_toml.write_text('[dependencies]\nBevy = "0.14"\n')
+        with mock.patch.object(self.engine.logger, "warning") as warning:
+            self.assertTrue(self.engine.validate_project())
+            warning.assert_not_called()
+
+    def test_migrate_skips_steps_without_matching_files(self):
+        self.cargo_toml.write_text('[dependencies]\nbevy = "0.16"\n')
+        (self.project_path / "src").mkdir()
+        with mock.patch.object(self.engine, "_get_migration", wraps=self.engine._get_migration) as get_migration:
+            self.assertTrue(self.engine.migrate("0.16", "0.17"))
+        self.assertEqual([call.args[0] for call in get_migration.call_args_list], ["0.17-part2->0.17"])
+        self.assertEqual(self.cargo_toml.read_text(), '[dependencies]\nbevy = "0.17"\n')
+        self.assertEqual(
+            (self.engine.backup_dir / "Cargo.toml").read_text(),
+            '[dependencies]\nbevy = "0.16"\n',
+        )
+
+    def test_cargo_toml_read_once_across_checks(self):
+        self.cargo_toml.write_text('[dependencies]\nbevy = "0.14"\n')
+        (self.project_path / "main.rs").write_text("fn main() {}\n")
+        invalidate_cargo_cache()
+        with mock.patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+            self.assertTrue(self.engine.validate_project())
+            self.assertEqual(self.engine.version_detector.detect_version(self.project_path), "0.14")
+            self.engine._update_project_version("0.15")
+            cargo_reads = [call for call in read_bytes.call_args_list if call.args[0] == self.cargo_toml]
+            self.assertEqual(len(cargo_reads), 1)
+
+            self.assertEqual(self.engine.version_detector.detect_version(self.project_path), "0.15")
+
+
+class TestMigrationEngineBackup(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.test_dir)
+        (self.project_path / "Cargo.toml").write_text('[dependencies]\nbevy = "0.14"\n')
+        (self.project_path / "Cargo.lock").write_text("# lock\n")
+        self.sources = {}
+        for index in range(20):
+            relative = f"src/m{index % 3}/f{index}.rs"
+            self.sources[relative] = f"fn f{index}() {{}}\n"
+        self.sources["assets/empty/.keep"] = ""
+        for relative, content in self.sources.items():
+            path = self.project_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        (self.project_path / "src" / "m0" / "f0.rs").chmod(0o640)
+        self.engine = MigrationEngine(project_path=self.project_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_create_backup_copies_tree(self):
+        (self.project_path / "assets" / "textures" / "unused").mkdir(parents=True)
+        source_dir = self.project_path / "src" / "m0"
+        source_dir.chmod(0o750)
+        os.utime(source_dir, ns=(1_000_000_000, 1_000_000_000))
+        with self.assertLogs("bevymigrate.core.migration_engine", level="DEBUG") as logs:
+            self.assertTrue(self.engine._create_backup())
+        self.assertTrue(logs.output[-1].endswith("Backup created successfully"))
+        self.assertTrue(any("Backed up:" in line for line in logs.output))
+        copied_dir = self.engine.backup_dir / "src" / "m0"
+        self.assertEqual(copied_dir.stat().st_mode, source_dir.stat().st_mode)
+        self.assertEqual(copied_dir.stat().st_mtime_ns, 1_000_000_000)
+        backup_path = self.engine.backup_dir
+        self.assertTrue((backup_path / "assets" / "textures" / "unused").is_dir())
+        self.assertEqual((backup_path / "Cargo.toml").read_text(), '[dependencies]\nbevy = "0.14"\n')
+        self.assertEqual((backup_path / "Cargo.lock").read_text(), "# lock\n")
+        for relative, content in self.sources.items():
+            self.assertEqual((backup_path / relative).read_text(), content, relative)
+        source = self.project_path / "src" / "m0" / "f0.rs"
+        copy = backup_path / "src" / "m0" / "f0.rs"
+        self.assertEqual(copy.stat().st_mode, source.stat().st_mode)
+        self.assertEqual(copy.stat().st_mtime_ns, source.stat().st_mtime_ns)
+
+    def test_create_backup_limited_to_affected_patterns(self):
+        (self.project_path / "tools").mkdir()
+        (self.project_path / "tools" / "gen.rs").write_text("fn gen() {}\n")
+        patterns = self.engine._get_affected_patterns([("0.16", "0.17-part1", "0.16->0.17-part1"), ("0.17", "0.18", "0.17->0.18")])
+        self.assertIn("**/*.rs", patterns)
+        self.assertIn("Cargo.toml", patterns)
+
+        self.assertTrue(self.engine._create_backup(patterns=patterns))
+        backup_path = self.engine.backup_dir
+        backed_up = sorted(
+            str(path.relative_to(backup_path)).replace('\\', '/')
+            for path in backup_path.rglob("*") if path.is_file()
+        )
+        expected = sorted(
+            ["Cargo.toml", "Cargo.lock", "tools/gen.rs"]
+            + [relative for relative in self.sources if relative.endswith(".rs")]
+        )
+        self.assertEqual(backed_up, expected)
+        self.assertEqual((backup_path / "src" / "m1" / "f1.rs").read_text(), "fn f1() {}\n")
+        self.assertEqual(
+            (backup_path / "src" / "m0" / "f0.rs").stat().st_mode,
+            (self.project_path / "src" / "m0" / "f0.rs").stat().st_mode,
+        )
+
+
+class TestMigrationEngineRegistry(unittest.TestCase):
+    def test_registry_entries_resolve_to_migrations(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            engine = MigrationEngine(project_path=Path(test_dir))
+            for key, spec in engine._migration_registry.items():
+                migration_class = _load_migration_class(spec)
+                self.assertTrue(issubclass(migration_class, BaseMigration), key)
+                self.assertIs(_load_migration_class(spec), migration_class)
+                self.assertTrue(migration_class.DESCRIPTION, key)
+                self.assertIn("**/*.rs", migration_class.AFFECTED_PATTERNS, key)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_summary_reads_class_metadata(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            engine = MigrationEngine(project_path=Path(test_dir))
+            with mock.patch.object(BaseMigration, "__init__", side_effect=AssertionError("instantiated")):
+                summary = engine.get_migration_summary("0.16", "0.18")
+            self.assertNotIn("error", summary)
+            steps = summary["migration_steps"]
+            self.assertEqual([step["step"] for step in steps], ["0.16->0.17-part1", "0.17-part1->0.17-part2", "0.17-part2->0.17", "0.17->0.18"])
+            migration_class = _load_migration_class(engine._migration_registry["0.17->0.18"])
+            self.assertEqual(steps[-1]["description"], migration_class.DESCRIPTION)
+            self.assertEqual(steps[-1]["affected_patterns"], list(migration_class.AFFECTED_PATTERNS))
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_version_validation(self):
+        self.assertLess(BevyVersion.parse("0.14"), BevyVersion.parse("0.15"))
+        self.assertEqual(BevyVersion.parse("0.19-part1"), BevyVersion.V0_19_PART1)
+        self.assertEqual(BevyVersion.V0_19_PART1.label, "0.19-part1")
+        with self.assertRaises(ValueError):
+            BevyVersion.parse("0.15-part1")
+
+        test_dir = tempfile.mkdtemp()
+        try:
+            engine = MigrationEngine(project_path=Path(test_dir))
+            self.assertTrue(engine._validate_versions("0.14", "0.15"))
+            self.assertFalse(engine._validate_versions("0.16", "0.14"))
+            self.assertFalse(engine._validate_versions("0.16", "0.16"))
+            self.assertFalse(engine._validate_versions("0.11", "0.16"))
+            self.assertFalse(engine._validate_versions("0.16", "1.0"))
+            for version in BevyVersion:
+                if version > BevyVersion.V0_12:
+                    self.assertTrue(engine._get_migration_path("0.12", version.label), version.label)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_migration_instances_reused(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            engine = MigrationEngine(project_path=Path(test_dir), dry_run=True)
+            migration = engine._get_migration("0.17->0.18", True)
+            self.assertIs(engine._get_migration("0.17->0.18", True), migration)
+            self.assertTrue(migration.dry_run)
+            self.assertIs(migration.file_manager, engine.file_manager)
+            self.assertIsNot(engine._get_migration("0.17->0.18", False), migration)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_migration_paths(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            engine = MigrationEngine(project_path=Path(test_dir))
+            self.assertEqual(
+                engine._get_migration_path("0.14", "0.16"),
+                (
+                    ("0.14", "0.15-part1", "0.14->0.15-part1"),
+                    ("0.15-part1", "0.15", "0.15-part1->0.15"),
+                    ("0.15", "0.16", "0.15->0.16"),
+                ),
+            )
+            self.assertIs(engine._get_migration_path("0.14", "0.16"), engine._get_migration_path("0.14", "0.16"))
+            self.assertEqual(len(engine._get_migration_path("0.12", "0.19-part1")), 10)
+            self.assertEqual(engine._get_migration_path("0.16", "0.14"), ())
+            self.assertEqual(engine._get_migration_path("0.16", "0.16"), ())
+            self.assertEqual(engine._get_migration_path("0.11", "0.16"), ())
+            for step_from, step_to, migration_key in engine._get_migration_path("0.12", "0.19-part1"):
+                self.assertEqual(migration_key, f"{step_from}->{step_to}")
+                self.assertIn(migration_key, engine._migration_registry)
+        finally:
+            shutil.rmtree(test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
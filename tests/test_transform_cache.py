@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+import unittest
+import tempfile
+import shutil
+import sqlite3
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bevymigrate.core.transform_cache import TransformCache
+
+
+class TestTransformCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_dir = Path(self.test_dir) / "cache"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip(self):
+        cache = TransformCache(self.cache_dir, b"f" * 16, namespace="a")
+        cache.put(b"digest", (0, 2), "new", ["Rename"])
+        cache.put(b"other", (0,), None, [])
+        cache.close()
+
+        cache = TransformCache(self.cache_dir, b"f" * 16, namespace="a")
+        self.assertEqual(cache.get(b"digest", (0, 2)), ("new", ["Rename"]))
+        self.assertEqual(cache.get(b"other", (0,)), (None, []))
+        self.assertIsNone(cache.get(b"digest", (0,)))
+        cache.close()
+
+    def test_older_fingerprints_pruned_per_namespace(self):
+        for namespace in ("a", "b"):
+            cache = TransformCache(self.cache_dir, b"old" * 4, namespace=namespace)
+            cache.put(b"digest", (0,), "new", ["Rename"])
+            cache.close()
+
+        TransformCache(self.cache_dir, b"new" * 4, namespace="a").close()
+
+        connection = sqlite3.connect(str(self.cache_dir / TransformCache.DATABASE_NAME))
+        try:
+            rows = connection.execute("SELECT namespace FROM transforms").fetchall()
+        finally:
+            connection.close()
+        self.assertEqual(rows, [("b",)])
+
+    def test_older_schema_rebuilt(self):
+        self.cache_dir.mkdir()
+        connection = sqlite3.connect(str(self.cache_dir / TransformCache.DATABASE_NAME))
+        connection.execute("CREATE TABLE transforms (key BLOB PRIMARY KEY, transformed TEXT, applied TEXT NOT NULL)")
+        connection.commit()
+        connection.close()
+
+        cache = TransformCache(self.cache_dir, b"f" * 16, namespace="a")
+        cache.put(b"digest", (0,), "new", ["Rename"])
+        self.assertEqual(cache.get(b"digest", (0,)), ("new", ["Rename"]))
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()